@@ -13,6 +13,11 @@ class Settings(BaseSettings):
     # OpenAI
     OPENAI_API_KEY: str
     
+    # Local Whisper (faster-whisper); use device="cuda", compute_type="float16" on GPU
+    WHISPER_LOCAL_MODEL: Optional[str] = "small.en"
+    WHISPER_DEVICE: str = "cpu"
+    WHISPER_COMPUTE_TYPE: str = "int8"
+    
     # Twilio
     TWILIO_ACCOUNT_SID: str
     TWILIO_AUTH_TOKEN: str
@@ -3,6 +3,25 @@ from dataclasses import dataclass
 from decimal import Decimal
 import statistics
 
+# Presentational precision for TCO fields, applied once at the output boundary
+_TCO_PRECISION = {
+    "total_monthly_cost": 2,
+    "cost_per_call": 2,
+    "savings_percentage": 1
+}
+
+def format_tco(analysis: Dict[str, Any]) -> Dict[str, Any]:
+    """Round the presentational fields of a TCO analysis in a single traversal"""
+    formatted = {}
+    for key, value in analysis.items():
+        if isinstance(value, dict):
+            formatted[key] = format_tco(value)
+        elif key in _TCO_PRECISION:
+            formatted[key] = round(value, _TCO_PRECISION[key])
+        else:
+            formatted[key] = value
+    return formatted
+
 @dataclass
 class CompetitorProfile:
     name: str
@@ -96,7 +115,7 @@ class AdvancedCostAnalysisService:
                                       calls_per_month: int,
                                       avg_agent_salary: float,
                                       industry: str) -> Dict[str, Any]:
-        """Detailed TCO analysis including hidden costs"""
+        """Detailed TCO analysis including hidden costs (unrounded; see format_tco)"""
         
         # Direct costs
         direct_costs = self._calculate_direct_costs(num_agents, avg_agent_salary)
@@ -118,8 +137,8 @@ class AdvancedCostAnalysisService:
         ])
         
         return {
-            "total_monthly_cost": round(total_monthly_cost, 2),
-            "cost_per_call": round(total_monthly_cost / calls_per_month, 2),
+            "total_monthly_cost": total_monthly_cost,
+            "cost_per_call": total_monthly_cost / calls_per_month,
             "breakdown": {
                 "direct_costs": direct_costs,
                 "indirect_costs": indirect_costs,
@@ -249,7 +268,7 @@ class AdvancedCostAnalysisService:
             
             comparisons[competitor] = {
                 "their_cost": profile.avg_cost_per_call,
-                "savings_percentage": round(savings_percentage, 1),
+                "savings_percentage": savings_percentage,
                 "features": profile.features,
                 "limitations": profile.limitations,
                 "market_focus": profile.market_focus
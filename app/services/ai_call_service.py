@@ -4,6 +4,35 @@ from openai import OpenAI
 from app.core.config import settings
 import json
 import asyncio
+import io
+import threading
+
+try:
+    from faster_whisper import WhisperModel
+except ImportError:  # Local transcription is optional; fall back to the OpenAI API
+    WhisperModel = None
+
+_WHISPER = None
+_WHISPER_LOCK = threading.Lock()
+
+def _get_local_whisper():
+    """Lazily loads the shared CTranslate2 Whisper model, or None if unavailable"""
+    global _WHISPER
+    if _WHISPER is None and WhisperModel is not None and settings.WHISPER_LOCAL_MODEL:
+        with _WHISPER_LOCK:
+            if _WHISPER is None:
+                _WHISPER = WhisperModel(
+                    settings.WHISPER_LOCAL_MODEL,
+                    device=settings.WHISPER_DEVICE,
+                    compute_type=settings.WHISPER_COMPUTE_TYPE
+                )
+    return _WHISPER
+
+def _transcribe_local(audio: bytes) -> str:
+    """Loads the model if needed and decodes every segment; blocking, run it off the event loop"""
+    # transcribe() only sets up a lazy generator; the decoding happens while joining
+    segments, _ = _get_local_whisper().transcribe(io.BytesIO(audio))
+    return " ".join(segment.text.strip() for segment in segments)
 
 class AICallService:
     def __init__(self):
@@ -57,7 +86,10 @@ class AICallService:
         }
     
     async def _transcribe_audio(self, audio: bytes) -> str:
-        """Transcribes audio using OpenAI Whisper"""
+        """Transcribes audio locally with faster-whisper, falling back to OpenAI Whisper"""
+        if WhisperModel is not None and settings.WHISPER_LOCAL_MODEL:
+            return await asyncio.to_thread(_transcribe_local, audio)
+        
         transcript = await self.openai_client.audio.transcriptions.create(
             file=audio,
             model="whisper-1"
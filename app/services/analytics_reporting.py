@@ -1,21 +1,234 @@
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from dataclasses import dataclass
 from datetime import datetime, timedelta
+from collections import Counter, namedtuple
+from functools import lru_cache
 import pandas as pd
 import numpy as np
-from sklearn.linear_model import LinearRegression
-from sklearn.preprocessing import PolynomialFeatures
+try:
+    # Intel Extension for Scikit-learn must patch before estimators are imported
+    from sklearnex import patch_sklearn
+    patch_sklearn()
+except ImportError:
+    pass
+from sklearn.linear_model import Ridge
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
 import smtplib
+import threading
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from email.mime.application import MIMEApplication
 import json
+from string import Template
 import plotly.graph_objects as go
+import plotly.io as pio
 from plotly.subplots import make_subplots
-import schedule
-import time
-import threading
-from app.services.roi_tracking import ROITrackingService, ImplementationPhase
+from concurrent.futures import ThreadPoolExecutor
+from apscheduler.schedulers.background import BackgroundScheduler
+from apscheduler.triggers.cron import CronTrigger
+from app.services.roi_tracking import ROITrackingService, ImplementationPhase, fast_mean
+
+# Report charts never use LaTeX; skipping MathJax cuts Kaleido startup time
+_kaleido_scope = getattr(pio.kaleido, "scope", None)
+if _kaleido_scope is not None:
+    _kaleido_scope.mathjax = None
+
+MAX_POLYNOMIAL_DEGREE = 3
+RIDGE_ALPHA = 1e-3
+
+@dataclass
+class PolynomialBasis:
+    feature_names: List[str]
+    # Column k >= n_features of the expansion is
+    # out[:, parent_columns[k - n_features]] * X[:, product_features[k - n_features]]
+    parent_columns: np.ndarray
+    product_features: np.ndarray
+    degree_bounds: List[int]
+
+def _monomial_name(term: Tuple[int, ...], feature_columns: List[str]) -> str:
+    """Name a monomial like PolynomialFeatures does, e.g. 'a^2 b'"""
+    return " ".join(
+        feature_columns[i] if power == 1 else f"{feature_columns[i]}^{power}"
+        for i, power in Counter(term).items()
+    )
+
+def _build_polynomial_basis(feature_columns: List[str],
+                            max_degree: int,
+                            feature_groups: List[int]) -> PolynomialBasis:
+    """Plan an incremental polynomial expansion (without bias column) up to max_degree
+    
+    Each degree-d monomial is its degree-(d-1) parent times one input feature, so
+    expansion reuses the previous block instead of recomputing lower degrees.
+    Columns are ordered by degree: the first degree_bounds[d-1] columns form the
+    complete degree-d expansion.
+    
+    feature_groups assigns each one-hot column its categorical group (-1 for
+    numeric columns). A one-hot column never multiplies a column from its own
+    group: x^k == x for binary x, and two columns of one category are never
+    both set, so those monomials are duplicates or identically zero.
+    """
+    n_features = len(feature_columns)
+    terms = [(i,) for i in range(n_features)]
+    feature_names = list(feature_columns)
+    parent_columns, product_features = [], []
+    degree_bounds = [n_features]
+    
+    for _ in range(2, max_degree + 1):
+        # Terms of the previous degree start at this column of the expansion
+        offset = degree_bounds[-2] if len(degree_bounds) > 1 else 0
+        next_terms = []
+        for parent, term in enumerate(terms):
+            term_groups = {feature_groups[i] for i in term}
+            for j in range(term[-1], n_features):
+                if feature_groups[j] >= 0 and feature_groups[j] in term_groups:
+                    continue
+                next_terms.append(term + (j,))
+                parent_columns.append(offset + parent)
+                product_features.append(j)
+        
+        feature_names.extend(_monomial_name(term, feature_columns) for term in next_terms)
+        degree_bounds.append(degree_bounds[-1] + len(next_terms))
+        terms = next_terms
+    
+    return PolynomialBasis(
+        feature_names,
+        np.array(parent_columns, dtype=np.int32),
+        np.array(product_features, dtype=np.int32),
+        degree_bounds
+    )
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def _expand_rows(X, out, parent_columns, product_features):
+        """Fill out row by row; parents always precede their products"""
+        n_features = X.shape[1]
+        for i in prange(X.shape[0]):
+            for j in range(n_features):
+                out[i, j] = X[i, j]
+            for k in range(parent_columns.shape[0]):
+                out[i, n_features + k] = out[i, parent_columns[k]] * X[i, product_features[k]]
+else:
+    _expand_rows = None
+
+def _expand_polynomial(X: np.ndarray, basis: PolynomialBasis) -> np.ndarray:
+    """Expand X into every monomial of the basis, written into one preallocated array"""
+    n_features = X.shape[1]
+    out = np.empty((X.shape[0], basis.degree_bounds[-1]), dtype=X.dtype)
+    if _expand_rows is not None:
+        _expand_rows(X, out, basis.parent_columns, basis.product_features)
+        return out
+    
+    out[:, :n_features] = X
+    for lo, hi in zip(basis.degree_bounds, basis.degree_bounds[1:]):
+        parents = basis.parent_columns[lo - n_features:hi - n_features]
+        features = basis.product_features[lo - n_features:hi - n_features]
+        np.multiply(out[:, parents], X[:, features], out=out[:, lo:hi])
+    return out
+
+# Kaleido renders in its own subprocess, so threads are enough to overlap
+# figures; one long-lived pool instead of a new executor per report
+_RENDER_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix='report-render')
+
+def _fig_to_png_bytes(fig: go.Figure) -> bytes:
+    """Render a figure to PNG"""
+    return pio.to_image(fig, format="png", engine="kaleido")
+
+# Report markup is parsed once at import; tables are assembled from row
+# fragments with ''.join to keep rendering linear in the number of rows
+_REPORT_TEMPLATE = Template("""
+        <html>
+        <head>
+            <style>
+                body { font-family: Arial, sans-serif; }
+                .section { margin: 20px 0; padding: 20px; border: 1px solid #ddd; }
+                .metric { font-size: 24px; color: #2c3e50; }
+                .label { font-size: 14px; color: #7f8c8d; }
+            </style>
+        </head>
+        <body>
+            <h1>Weekly Implementation Analytics Report</h1>
+            <p>Week of $week_start to $week_end</p>
+            
+            <div class="section">
+                <h2>Implementation Overview</h2>
+                <div class="metric">$active_implementations</div>
+                <div class="label">Active Implementations</div>
+                <div class="metric">$completed_this_week</div>
+                <div class="label">Completed This Week</div>
+                <div class="metric">$$$total_cost_savings</div>
+                <div class="label">Total Cost Savings</div>
+            </div>
+            
+            <div class="section">
+                <h2>Performance Summary</h2>
+                $performance_html
+            </div>
+            
+            <div class="section">
+                <h2>Industry Breakdown</h2>
+                $industry_html
+            </div>
+            
+            <div class="section">
+                <h2>Predictive Insights</h2>
+                $predictions_html
+            </div>
+        </body>
+        </html>
+        """)
+
+_PERFORMANCE_TEMPLATE = """
+        <div class="metric">{avg_implementation_days:.1f} days</div>
+        <div class="label">Average Implementation Time</div>
+        <div class="metric">${avg_cost_savings:,.2f}</div>
+        <div class="label">Average Cost Savings</div>
+        <div class="metric">{avg_efficiency_gain:.1f}%</div>
+        <div class="label">Average Efficiency Gain</div>
+        <div class="metric">{avg_quality_improvement:.1f}%</div>
+        <div class="label">Average Quality Improvement</div>
+        """
+
+_INDUSTRY_ROW = """
+            <tr>
+                <td>{industry}</td>
+                <td>{active_count}</td>
+                <td>{completed_count}</td>
+                <td>${total_savings:,.2f}</td>
+                <td>{avg_efficiency:.1f}%</td>
+            </tr>
+            """
+
+@lru_cache(maxsize=256)
+def _render_industry_row(industry: str,
+                         active: int,
+                         completed: int,
+                         savings_x100: int,
+                         efficiency_x10: int) -> str:
+    """Render one industry table row from display-rounded integer values"""
+    return _INDUSTRY_ROW.format(
+        industry=industry,
+        active_count=active,
+        completed_count=completed,
+        total_savings=savings_x100 / 100,
+        avg_efficiency=efficiency_x10 / 10
+    )
+
+_PREDICTION_ROW = """
+            <tr>
+                <td>{metric}</td>
+                <td>{model_accuracy}%</td>
+                <td>{factors}</td>
+            </tr>
+            """
+
+# Flat per-implementation record holding only the fields the weekly report reads
+ImplSummary = namedtuple(
+    "ImplSummary",
+    "industry completion_date trad_sum actual_sum savings impl_days eff_mean qual_mean phase"
+)
 
 @dataclass
 class PredictiveModel:
@@ -24,6 +237,10 @@ class PredictiveModel:
     model: Any
     polynomial_degree: int = 1
     r_squared: float = 0.0
+    # Unscaled coefficients for the degree's column prefix, so prediction is
+    # a plain dot product without sklearn's input validation
+    coef: Optional[np.ndarray] = None
+    intercept: float = 0.0
 
 class AnalyticsReportingService:
     def __init__(self,
@@ -32,20 +249,21 @@ class AnalyticsReportingService:
         self.roi_service = roi_service
         self.email_config = email_config
         self.predictive_models: Dict[str, PredictiveModel] = {}
+        self._polynomial_basis: Optional[PolynomialBasis] = None
+        self._feature_index: Dict[str, int] = {}
+        self._smtp: Optional[smtplib.SMTP] = None
+        self._smtp_lock = threading.Lock()
         self._setup_scheduler()
 
     def _setup_scheduler(self):
         """Setup weekly report scheduler"""
-        schedule.every().friday.at("17:00").do(self.generate_and_send_weekly_report)
-        
-        # Run scheduler in background thread
-        def run_scheduler():
-            while True:
-                schedule.run_pending()
-                time.sleep(60)
-        
-        scheduler_thread = threading.Thread(target=run_scheduler, daemon=True)
-        scheduler_thread.start()
+        # The scheduler thread sleeps until the next fire time instead of polling
+        self._scheduler = BackgroundScheduler(daemon=True)
+        self._scheduler.add_job(
+            self.generate_and_send_weekly_report,
+            CronTrigger(day_of_week="fri", hour=17, minute=0)
+        )
+        self._scheduler.start()
 
     def train_predictive_models(self):
         """Train predictive models using historical implementation data"""
@@ -53,22 +271,40 @@ class AnalyticsReportingService:
         if not implementations:
             return
         
-        # Prepare training data
-        df = pd.DataFrame([
-            {
-                "industry": impl.industry,
-                "call_volume": impl.initial_call_volume,
-                "subscription_tier": impl.subscription_tier,
-                "implementation_days": sum(impl.phase_durations.values(), timedelta()).days if impl.completion_date else None,
-                "cost_savings": (sum(impl.traditional_costs.values()) - sum(impl.actual_costs.values())) 
-                    if impl.completion_date else None,
-                "efficiency_gain": statistics.mean(impl.efficiency_metrics.values()) * 100 
-                    if impl.efficiency_metrics and impl.completion_date else None,
-                "quality_improvement": statistics.mean(impl.quality_metrics.values()) * 100 
-                    if impl.quality_metrics and impl.completion_date else None
-            }
-            for impl in implementations
-        ])
+        # Prepare training data as typed columns filled in a single pass;
+        # incomplete implementations are NaN-encoded and dropped below
+        n = len(implementations)
+        industry = np.empty(n, dtype=object)
+        subscription_tier = np.empty(n, dtype=object)
+        call_volume = np.empty(n, dtype=np.int64)
+        implementation_days = np.full(n, np.nan)
+        cost_savings = np.full(n, np.nan)
+        efficiency_gain = np.full(n, np.nan)
+        quality_improvement = np.full(n, np.nan)
+        
+        for i, impl in enumerate(implementations):
+            industry[i] = impl.industry
+            subscription_tier[i] = impl.subscription_tier
+            call_volume[i] = impl.initial_call_volume
+            if not impl.completion_date:
+                continue
+            
+            implementation_days[i] = sum(impl.phase_durations.values(), timedelta()).days
+            cost_savings[i] = impl.savings
+            if impl.efficiency_metrics:
+                efficiency_gain[i] = fast_mean(impl.efficiency_metrics) * 100
+            if impl.quality_metrics:
+                quality_improvement[i] = fast_mean(impl.quality_metrics) * 100
+        
+        df = pd.DataFrame({
+            "industry": industry,
+            "call_volume": call_volume,
+            "subscription_tier": subscription_tier,
+            "implementation_days": implementation_days,
+            "cost_savings": cost_savings,
+            "efficiency_gain": efficiency_gain,
+            "quality_improvement": quality_improvement
+        })
         
         # Remove incomplete implementations
         df = df.dropna()
@@ -76,9 +312,6 @@ class AnalyticsReportingService:
         if len(df) < 3:  # Need minimum data points for meaningful predictions
             return
         
-        # Encode categorical variables
-        df = pd.get_dummies(df, columns=["industry", "subscription_tier"])
-        
         # Train models for different metrics
         target_metrics = [
             "implementation_days",
@@ -87,37 +320,72 @@ class AnalyticsReportingService:
             "quality_improvement"
         ]
         
-        feature_columns = [col for col in df.columns 
-                         if col not in target_metrics]
+        # Encode categorical variables sparsely and scatter the ones straight
+        # into the float32 feature matrix; no dense dummy frame is built
+        categorical_columns = ["industry", "subscription_tier"]
+        onehot = pd.get_dummies(df[categorical_columns], sparse=True, dtype=np.float32)
+        feature_columns = ["call_volume", *onehot.columns]
+        feature_groups = [-1] + [
+            group
+            for group, name in enumerate(categorical_columns)
+            for _ in range(df[name].nunique())
+        ]
         
-        for target in target_metrics:
-            X = df[feature_columns]
-            y = df[target]
+        X = np.zeros((len(df), len(feature_columns)), dtype=np.float32)
+        X[:, 0] = df["call_volume"].to_numpy(dtype=np.float32)
+        onehot_coo = onehot.sparse.to_coo()
+        X[onehot_coo.row, onehot_coo.col + 1] = onehot_coo.data
+        
+        # Expand once at the highest degree; lower degrees are column prefixes.
+        # float32 is ample for these metrics and halves the expansion bandwidth
+        basis = _build_polynomial_basis(feature_columns, MAX_POLYNOMIAL_DEGREE, feature_groups)
+        X_poly = _expand_polynomial(X, basis)
+        self._polynomial_basis = basis
+        self._feature_index = {column: i for i, column in enumerate(feature_columns)}
+        
+        # Unit-scale the columns (call_volume^3 alone reaches ~1e11) so the
+        # float32 solve stays well-conditioned; coefficients are mapped back below
+        column_scale = np.abs(X_poly).max(axis=0)
+        column_scale[column_scale == 0] = 1
+        X_poly /= column_scale
+        
+        # Fit every target at once per degree so the solve is factorized once;
+        # with a shared alpha this matches fitting each target separately
+        Y = df[target_metrics].to_numpy(dtype=np.float32)
+        ss_tot = np.sum((Y - Y.mean(axis=0)) ** 2, axis=0)
+        
+        # Try different polynomial degrees
+        best_models = [None] * len(target_metrics)
+        best_r2 = np.full(len(target_metrics), -np.inf)
+        best_degree = np.ones(len(target_metrics), dtype=np.intp)
+        
+        for degree, n_columns in enumerate(basis.degree_bounds, start=1):
+            X_degree = X_poly[:, :n_columns]
             
-            # Try different polynomial degrees
-            best_model = None
-            best_r2 = -float('inf')
-            best_degree = 1
-            
-            for degree in [1, 2, 3]:
-                poly = PolynomialFeatures(degree=degree)
-                X_poly = poly.fit_transform(X)
-                
-                model = LinearRegression()
-                model.fit(X_poly, y)
-                r2 = model.score(X_poly, y)
-                
-                if r2 > best_r2:
-                    best_r2 = r2
-                    best_model = model
-                    best_degree = degree
+            model = Ridge(alpha=RIDGE_ALPHA)
+            model.fit(X_degree, Y)
+            residuals = Y - (X_degree @ model.coef_.T + model.intercept_)
+            ss_res = np.sum(residuals ** 2, axis=0)
+            # R² is reported as 0 for a constant target
+            r2 = 1 - np.divide(ss_res, ss_tot, out=np.ones_like(ss_res), where=ss_tot > 0)
+            model.coef_ = model.coef_ / column_scale[:n_columns]
             
+            improved = r2 > best_r2
+            best_r2[improved] = r2[improved]
+            best_degree[improved] = degree
+            for t in np.flatnonzero(improved):
+                best_models[t] = model
+        
+        for t, target in enumerate(target_metrics):
+            model = best_models[t]
             self.predictive_models[target] = PredictiveModel(
                 feature_columns=feature_columns,
                 target_column=target,
-                model=best_model,
-                polynomial_degree=best_degree,
-                r_squared=best_r2
+                model=model,
+                polynomial_degree=int(best_degree[t]),
+                r_squared=float(best_r2[t]),
+                coef=model.coef_[t].astype(np.float32),
+                intercept=float(model.intercept_[t])
             )
 
     def predict_implementation_metrics(self,
@@ -130,35 +398,24 @@ class AnalyticsReportingService:
             if not self.predictive_models:
                 return {}
         
-        # Prepare input data
-        input_data = pd.DataFrame([{
-            "call_volume": call_volume,
-            "industry": industry,
-            "subscription_tier": subscription_tier
-        }])
+        # Encode the single input row against the training columns
+        basis = self._polynomial_basis
+        input_row = np.zeros((1, len(self._feature_index)), dtype=np.float32)
+        input_row[0, self._feature_index["call_volume"]] = call_volume
+        for column in (f"industry_{industry}", f"subscription_tier_{subscription_tier}"):
+            index = self._feature_index.get(column)
+            if index is not None:
+                input_row[0, index] = 1
+        
+        # Expand once; each model reads the column prefix for its degree
+        input_poly = _expand_polynomial(input_row, basis)[0]
         
         # Generate predictions
         predictions = {}
         for metric, model in self.predictive_models.items():
-            # Encode categorical variables
-            input_encoded = pd.get_dummies(input_data)
-            
-            # Add missing columns from training
-            for col in model.feature_columns:
-                if col not in input_encoded.columns:
-                    input_encoded[col] = 0
-            
-            # Reorder columns to match training data
-            input_encoded = input_encoded[model.feature_columns]
-            
-            # Apply polynomial transformation
-            poly = PolynomialFeatures(degree=model.polynomial_degree)
-            input_poly = poly.fit_transform(input_encoded)
-            
-            # Make prediction
-            pred = model.model.predict(input_poly)[0]
+            pred = input_poly[:model.coef.size] @ model.coef + model.intercept
             predictions[metric] = {
-                "predicted_value": round(pred, 2),
+                "predicted_value": round(float(pred), 2),
                 "confidence": round(model.r_squared * 100, 2)
             }
         
@@ -173,11 +430,8 @@ class AnalyticsReportingService:
         # Get all implementations
         implementations = self.roi_service.implementation_data.values()
         
-        # Filter for active implementations this week
-        active_implementations = [
-            impl for impl in implementations
-            if not impl.completion_date or impl.completion_date >= week_start
-        ]
+        # Filter for active implementations this week, summarizing each once
+        summaries = self._summarize_implementations(implementations, week_start)
         
         # Calculate weekly metrics
         weekly_metrics = {
@@ -185,19 +439,17 @@ class AnalyticsReportingService:
                 "start": week_start.isoformat(),
                 "end": week_end.isoformat()
             },
-            "active_implementations": len(active_implementations),
+            "active_implementations": len(summaries),
             "completed_this_week": sum(
-                1 for impl in active_implementations
-                if impl.completion_date and impl.completion_date >= week_start
+                1 for s in summaries
+                if s.completion_date and s.completion_date >= week_start
             ),
             "total_cost_savings": sum(
-                sum(impl.traditional_costs.values()) - sum(impl.actual_costs.values())
-                for impl in active_implementations
-                if impl.completion_date
+                s.savings for s in summaries if s.completion_date
             ),
-            "phase_breakdown": self._calculate_phase_breakdown(active_implementations),
-            "industry_breakdown": self._calculate_industry_breakdown(active_implementations),
-            "performance_summary": self._calculate_performance_summary(active_implementations),
+            "phase_breakdown": self._calculate_phase_breakdown(summaries),
+            "industry_breakdown": self._calculate_industry_breakdown(summaries),
+            "performance_summary": self._calculate_performance_summary(summaries),
             "predictions": self._generate_prediction_insights()
         }
         
@@ -216,74 +468,98 @@ class AnalyticsReportingService:
         # Send email
         self._send_report_email(html_content, figures)
 
-    def _calculate_phase_breakdown(self,
-                                implementations: List[Any]) -> Dict[str, Any]:
+    def _summarize_implementations(self,
+                                implementations: List[Any],
+                                week_start: datetime) -> List[ImplSummary]:
+        """Build flat summaries for implementations active since week_start"""
+        summaries = []
+        
+        for impl in implementations:
+            if impl.completion_date and impl.completion_date < week_start:
+                continue
+            
+            summaries.append(ImplSummary(
+                industry=impl.industry,
+                completion_date=impl.completion_date,
+                trad_sum=impl.traditional_cost_total,
+                actual_sum=impl.actual_cost_total,
+                savings=impl.savings,
+                impl_days=sum(impl.phase_durations.values(), timedelta()).days,
+                eff_mean=fast_mean(impl.efficiency_metrics) if impl.efficiency_metrics else None,
+                qual_mean=fast_mean(impl.quality_metrics) if impl.quality_metrics else None,
+                phase=self.roi_service._get_current_phase(impl)
+            ))
+        
+        return summaries
+
+    @staticmethod
+    def _calculate_phase_breakdown(summaries: List[ImplSummary]) -> Dict[str, Any]:
         """Calculate implementation phase breakdown"""
         phase_counts = {phase.value: 0 for phase in ImplementationPhase}
         
-        for impl in implementations:
-            current_phase = self.roi_service._get_current_phase(impl)
-            phase_counts[current_phase] += 1
+        for s in summaries:
+            phase_counts[s.phase] += 1
         
         return phase_counts
 
-    def _calculate_industry_breakdown(self,
-                                   implementations: List[Any]) -> Dict[str, Any]:
+    @staticmethod
+    def _calculate_industry_breakdown(summaries: List[ImplSummary]) -> Dict[str, Any]:
         """Calculate industry-wise implementation metrics"""
-        industry_metrics = {}
+        if not summaries:
+            return {}
         
-        for impl in implementations:
-            if impl.industry not in industry_metrics:
-                industry_metrics[impl.industry] = {
-                    "active_count": 0,
-                    "completed_count": 0,
-                    "total_savings": 0,
-                    "avg_efficiency": 0
-                }
-            
-            metrics = industry_metrics[impl.industry]
-            metrics["active_count"] += 1
-            
-            if impl.completion_date:
-                metrics["completed_count"] += 1
-                metrics["total_savings"] += (
-                    sum(impl.traditional_costs.values()) - 
-                    sum(impl.actual_costs.values())
-                )
-                if impl.efficiency_metrics:
-                    metrics["avg_efficiency"] = statistics.mean(
-                        impl.efficiency_metrics.values()
-                    ) * 100
-        
-        return industry_metrics
-
-    def _calculate_performance_summary(self,
-                                    implementations: List[Any]) -> Dict[str, Any]:
+        df = pd.DataFrame(summaries, columns=ImplSummary._fields)
+        completed = df["completion_date"].notna()
+        df["completed"] = completed
+        df["completed_savings"] = df["savings"].where(completed, 0)
+        df["completed_efficiency"] = df["eff_mean"].astype(float).where(completed)
+        
+        # Savings and efficiency only count completed implementations; the
+        # efficiency is now averaged across them rather than last-one-wins
+        industry_metrics = df.groupby("industry", sort=False).agg(
+            active_count=("industry", "size"),
+            completed_count=("completed", "sum"),
+            total_savings=("completed_savings", "sum"),
+            avg_efficiency=("completed_efficiency", "mean")
+        )
+        industry_metrics["avg_efficiency"] = industry_metrics["avg_efficiency"].fillna(0) * 100
+        
+        return industry_metrics.to_dict(orient="index")
+
+    @staticmethod
+    def _calculate_performance_summary(summaries: List[ImplSummary]) -> Dict[str, Any]:
         """Calculate overall performance metrics"""
-        completed = [impl for impl in implementations if impl.completion_date]
+        # Single pass with running totals instead of one list per average
+        completed = 0
+        days_total = 0
+        savings_total = 0
+        efficiency_total = quality_total = 0.0
+        efficiency_count = quality_count = 0
+        
+        for s in summaries:
+            if not s.completion_date:
+                continue
+            
+            completed += 1
+            days_total += s.impl_days
+            savings_total += s.savings
+            if s.eff_mean is not None:
+                efficiency_total += s.eff_mean
+                efficiency_count += 1
+            if s.qual_mean is not None:
+                quality_total += s.qual_mean
+                quality_count += 1
         
         if not completed:
             return {}
         
         return {
-            "avg_implementation_days": statistics.mean([
-                sum(impl.phase_durations.values(), timedelta()).days
-                for impl in completed
-            ]),
-            "avg_cost_savings": statistics.mean([
-                sum(impl.traditional_costs.values()) - sum(impl.actual_costs.values())
-                for impl in completed
-            ]),
-            "avg_efficiency_gain": statistics.mean([
-                statistics.mean(impl.efficiency_metrics.values()) * 100
-                for impl in completed
-                if impl.efficiency_metrics
-            ]) if any(impl.efficiency_metrics for impl in completed) else 0,
-            "avg_quality_improvement": statistics.mean([
-                statistics.mean(impl.quality_metrics.values()) * 100
-                for impl in completed
-                if impl.quality_metrics
-            ]) if any(impl.quality_metrics for impl in completed) else 0
+            "avg_implementation_days": days_total / completed,
+            "avg_cost_savings": savings_total / completed,
+            "avg_efficiency_gain": (efficiency_total / efficiency_count * 100
+                                  if efficiency_count else 0),
+            "avg_quality_improvement": (quality_total / quality_count * 100
+                                      if quality_count else 0)
         }
 
     def _generate_prediction_insights(self) -> Dict[str, Any]:
@@ -302,61 +578,32 @@ class AnalyticsReportingService:
 
     def _identify_significant_factors(self, model: PredictiveModel) -> List[str]:
         """Identify most significant factors in prediction"""
-        if not model.model.coef_.any():
+        coef = model.coef
+        if coef.size == 0 or not coef.any():
             return []
         
         # Get absolute coefficient values
-        coef_importance = np.abs(model.model.coef_)
+        coef_importance = np.abs(coef)
         
-        # Get top 3 most important features
-        top_indices = np.argsort(coef_importance)[-3:]
+        # Get top 3 most important features; partial selection is O(n)
+        k = min(3, coef_importance.size)
+        top_part = np.argpartition(coef_importance, -k)[-k:]
+        top_indices = top_part[np.argsort(coef_importance[top_part])]
         
-        return [model.feature_columns[i] for i in top_indices]
+        return [self._polynomial_basis.feature_names[i] for i in top_indices]
 
     def _generate_html_report(self, report_data: Dict[str, Any]) -> str:
         """Generate HTML report content"""
-        html = f"""
-        <html>
-        <head>
-            <style>
-                body {{ font-family: Arial, sans-serif; }}
-                .section {{ margin: 20px 0; padding: 20px; border: 1px solid #ddd; }}
-                .metric {{ font-size: 24px; color: #2c3e50; }}
-                .label {{ font-size: 14px; color: #7f8c8d; }}
-            </style>
-        </head>
-        <body>
-            <h1>Weekly Implementation Analytics Report</h1>
-            <p>Week of {report_data['date_range']['start']} to {report_data['date_range']['end']}</p>
-            
-            <div class="section">
-                <h2>Implementation Overview</h2>
-                <div class="metric">{report_data['active_implementations']}</div>
-                <div class="label">Active Implementations</div>
-                <div class="metric">{report_data['completed_this_week']}</div>
-                <div class="label">Completed This Week</div>
-                <div class="metric">${report_data['total_cost_savings']:,.2f}</div>
-                <div class="label">Total Cost Savings</div>
-            </div>
-            
-            <div class="section">
-                <h2>Performance Summary</h2>
-                {self._format_performance_metrics(report_data['performance_summary'])}
-            </div>
-            
-            <div class="section">
-                <h2>Industry Breakdown</h2>
-                {self._format_industry_metrics(report_data['industry_breakdown'])}
-            </div>
-            
-            <div class="section">
-                <h2>Predictive Insights</h2>
-                {self._format_prediction_insights(report_data['predictions'])}
-            </div>
-        </body>
-        </html>
-        """
-        return html
+        return _REPORT_TEMPLATE.substitute(
+            week_start=report_data['date_range']['start'],
+            week_end=report_data['date_range']['end'],
+            active_implementations=report_data['active_implementations'],
+            completed_this_week=report_data['completed_this_week'],
+            total_cost_savings=f"{report_data['total_cost_savings']:,.2f}",
+            performance_html=self._format_performance_metrics(report_data['performance_summary']),
+            industry_html=self._format_industry_metrics(report_data['industry_breakdown']),
+            predictions_html=self._format_prediction_insights(report_data['predictions'])
+        )
 
     def _generate_report_visualizations(self,
                                      report_data: Dict[str, Any]) -> List[go.Figure]:
@@ -417,9 +664,13 @@ class AnalyticsReportingService:
         # Attach HTML content
         msg.attach(MIMEText(html_content, 'html'))
         
-        # Attach visualizations
-        for i, fig in enumerate(figures):
-            img_bytes = fig.to_image(format="png")
+        # Attach visualizations; figures render on the shared pool while the
+        # SMTP session comes up
+        png_blobs = _RENDER_POOL.map(_fig_to_png_bytes, figures)
+        with self._smtp_lock:
+            self._get_smtp_connection()
+        
+        for i, img_bytes in enumerate(png_blobs):
             img_attachment = MIMEApplication(img_bytes)
             img_attachment.add_header(
                 'Content-Disposition',
@@ -428,15 +679,53 @@ class AnalyticsReportingService:
             )
             msg.attach(img_attachment)
         
-        # Send email
-        with smtplib.SMTP(self.email_config['smtp_server'],
-                         self.email_config['smtp_port']) as server:
-            server.starttls()
-            server.login(
+        # Send email, reconnecting once if the server dropped the session
+        with self._smtp_lock:
+            try:
+                (self._smtp or self._get_smtp_connection()).send_message(msg)
+            except smtplib.SMTPServerDisconnected:
+                self._close_smtp()
+                self._get_smtp_connection().send_message(msg)
+
+    def _get_smtp_connection(self) -> smtplib.SMTP:
+        """Return the logged-in SMTP session, reconnecting if it has dropped"""
+        if self._smtp is not None:
+            try:
+                if self._smtp.noop()[0] == 250:
+                    return self._smtp
+            except (smtplib.SMTPException, OSError):
+                pass
+            self._close_smtp()
+        
+        server = self.email_config['smtp_server']
+        port = self.email_config['smtp_port']
+        if port == 465:
+            # Implicit TLS saves the STARTTLS round trip
+            smtp = smtplib.SMTP_SSL(server, port)
+        else:
+            smtp = smtplib.SMTP(server, port)
+        try:
+            if port != 465:
+                smtp.starttls()
+            smtp.login(
                 self.email_config['smtp_username'],
                 self.email_config['smtp_password']
             )
-            server.send_message(msg)
+        except Exception:
+            smtp.close()
+            raise
+        self._smtp = smtp
+        return smtp
+
+    def _close_smtp(self) -> None:
+        """Drop the SMTP session, if any"""
+        if self._smtp is None:
+            return
+        try:
+            self._smtp.quit()
+        except (smtplib.SMTPException, OSError):
+            self._smtp.close()
+        self._smtp = None
 
     @staticmethod
     def _format_performance_metrics(metrics: Dict[str, float]) -> str:
@@ -444,36 +733,26 @@ class AnalyticsReportingService:
         if not metrics:
             return "<p>No completed implementations in this period</p>"
         
-        return f"""
-        <div class="metric">{metrics['avg_implementation_days']:.1f} days</div>
-        <div class="label">Average Implementation Time</div>
-        <div class="metric">${metrics['avg_cost_savings']:,.2f}</div>
-        <div class="label">Average Cost Savings</div>
-        <div class="metric">{metrics['avg_efficiency_gain']:.1f}%</div>
-        <div class="label">Average Efficiency Gain</div>
-        <div class="metric">{metrics['avg_quality_improvement']:.1f}%</div>
-        <div class="label">Average Quality Improvement</div>
-        """
+        return _PERFORMANCE_TEMPLATE.format_map(metrics)
 
     @staticmethod
     def _format_industry_metrics(metrics: Dict[str, Dict[str, Any]]) -> str:
         """Format industry metrics for HTML display"""
-        html = "<table border='1' cellpadding='5'>"
-        html += "<tr><th>Industry</th><th>Active</th><th>Completed</th><th>Total Savings</th><th>Avg Efficiency</th></tr>"
-        
-        for industry, data in metrics.items():
-            html += f"""
-            <tr>
-                <td>{industry}</td>
-                <td>{data['active_count']}</td>
-                <td>{data['completed_count']}</td>
-                <td>${data['total_savings']:,.2f}</td>
-                <td>{data['avg_efficiency']:.1f}%</td>
-            </tr>
-            """
-        
-        html += "</table>"
-        return html
+        # Rows are cached on the values as displayed, so re-sending an
+        # unchanged report reuses the rendered markup
+        rows = "".join(
+            _render_industry_row(
+                industry,
+                int(data['active_count']),
+                int(data['completed_count']),
+                round(data['total_savings'] * 100),
+                round(data['avg_efficiency'] * 10)
+            )
+            for industry, data in metrics.items()
+        )
+        return ("<table border='1' cellpadding='5'>"
+                "<tr><th>Industry</th><th>Active</th><th>Completed</th><th>Total Savings</th><th>Avg Efficiency</th></tr>"
+                f"{rows}</table>")
 
     @staticmethod
     def _format_prediction_insights(insights: Dict[str, Dict[str, Any]]) -> str:
@@ -481,17 +760,14 @@ class AnalyticsReportingService:
         if not insights:
             return "<p>No prediction models available yet</p>"
         
-        html = "<table border='1' cellpadding='5'>"
-        html += "<tr><th>Metric</th><th>Model Accuracy</th><th>Key Factors</th></tr>"
-        
-        for metric, data in insights.items():
-            html += f"""
-            <tr>
-                <td>{metric}</td>
-                <td>{data['model_accuracy']}%</td>
-                <td>{', '.join(data['significant_factors'])}</td>
-            </tr>
-            """
-        
-        html += "</table>"
-        return html 
\ No newline at end of file
+        rows = "".join(
+            _PREDICTION_ROW.format(
+                metric=metric,
+                model_accuracy=data['model_accuracy'],
+                factors=', '.join(data['significant_factors'])
+            )
+            for metric, data in insights.items()
+        )
+        return ("<table border='1' cellpadding='5'>"
+                "<tr><th>Metric</th><th>Model Accuracy</th><th>Key Factors</th></tr>"
+                f"{rows}</table>")
@@ -1,13 +1,19 @@
-from werkzeug.security import generate_password_hash, check_password_hash
-from sqlalchemy import Column, Integer, String, create_engine, text
+from werkzeug.security import check_password_hash
+from argon2 import PasswordHasher
+from argon2.exceptions import VerificationError, InvalidHashError
+from sqlalchemy import Column, Integer, String, create_engine, event, text
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from contextlib import contextmanager
 import os
 from typing import Optional
 from flask_login import UserMixin
 
 Base = declarative_base()
 
+# Argon2id tuned to roughly 15ms per hash (RFC 9106 low-memory profile)
+_PH = PasswordHasher(time_cost=2, memory_cost=19456, parallelism=1)
+
 class User(Base, UserMixin):
     __tablename__ = 'users'
     
@@ -17,10 +23,21 @@ class User(Base, UserMixin):
     role = Column(String(20), nullable=False, default='user')
     
     def set_password(self, password):
-        self.password_hash = generate_password_hash(password)
+        self.password_hash = _PH.hash(password)
         
     def check_password(self, password):
-        return check_password_hash(self.password_hash, password)
+        if not self.password_hash.startswith('$argon2'):
+            # Werkzeug PBKDF2 hash stored before the switch to Argon2
+            return check_password_hash(self.password_hash, password)
+        try:
+            return _PH.verify(self.password_hash, password)
+        except (VerificationError, InvalidHashError):
+            return False
+    
+    def needs_rehash(self):
+        """Whether the stored hash is legacy or uses outdated Argon2 parameters"""
+        return (not self.password_hash.startswith('$argon2') or
+                _PH.check_needs_rehash(self.password_hash))
 
 class AuthService:
     def __init__(self):
@@ -35,58 +52,90 @@ class AuthService:
         # Create data directory if it doesn't exist
         os.makedirs(os.path.dirname(db_path), exist_ok=True)
         self.engine = create_engine(f'sqlite:///{db_path}')
+        event.listen(self.engine, 'connect', self._configure_connection)
         
         # Create tables
         Base.metadata.create_all(self.engine)
-        Session = sessionmaker(bind=self.engine)
-        self.session = Session()
+        
+        # Short-lived session per operation; objects stay usable after commit
+        self.SessionLocal = sessionmaker(bind=self.engine, expire_on_commit=False)
         
         # Create default admin user if not exists
         self.create_default_admin()
     
+    @staticmethod
+    def _configure_connection(dbapi_connection, connection_record):
+        """Apply SQLite pragmas to every new pooled connection"""
+        cursor = dbapi_connection.cursor()
+        # WAL lets logins read while a password change is being written
+        cursor.execute('PRAGMA journal_mode=WAL')
+        cursor.execute('PRAGMA synchronous=NORMAL')
+        cursor.execute('PRAGMA cache_size=-20000')
+        cursor.close()
+    
+    @contextmanager
+    def _session(self):
+        """Yield a session that is closed when the operation finishes"""
+        session = self.SessionLocal()
+        try:
+            yield session
+        finally:
+            session.close()
+    
     def create_default_admin(self):
         """Create default admin user if no users exist"""
-        if not self.session.query(User).first():
-            admin = User(
-                username='admin',
-                role='admin'
-            )
-            admin.set_password('admin123')  # Default password
-            self.session.add(admin)
-            self.session.commit()
-            print("Created default admin user (username: admin, password: admin123)")
+        with self._session() as session:
+            if not session.query(User).first():
+                admin = User(
+                    username='admin',
+                    role='admin'
+                )
+                admin.set_password('admin123')  # Default password
+                session.add(admin)
+                session.commit()
+                print("Created default admin user (username: admin, password: admin123)")
     
     def get_user(self, user_id: int) -> Optional[User]:
         """Get user by ID"""
-        return self.session.query(User).filter_by(id=user_id).first()
+        with self._session() as session:
+            return session.query(User).filter_by(id=user_id).first()
     
     def get_user_by_username(self, username: str) -> Optional[User]:
         """Get user by username"""
-        return self.session.query(User).filter_by(username=username).first()
+        with self._session() as session:
+            return session.query(User).filter_by(username=username).first()
     
     def authenticate_user(self, username: str, password: str) -> Optional[User]:
         """Authenticate user with username and password"""
-        user = self.get_user_by_username(username)
-        if user and user.check_password(password):
+        with self._session() as session:
+            user = session.query(User).filter_by(username=username).first()
+            if not user or not user.check_password(password):
+                return None
+            
+            # Upgrade legacy hashes transparently on successful login
+            if user.needs_rehash():
+                user.set_password(password)
+                session.commit()
             return user
-        return None
     
     def create_user(self, username: str, password: str, role: str = 'user') -> Optional[User]:
         """Create a new user"""
-        if self.get_user_by_username(username):
-            return None
-        
-        user = User(username=username, role=role)
-        user.set_password(password)
-        self.session.add(user)
-        self.session.commit()
-        return user
+        with self._session() as session:
+            if session.query(User).filter_by(username=username).first():
+                return None
+            
+            user = User(username=username, role=role)
+            user.set_password(password)
+            session.add(user)
+            session.commit()
+            return user
     
     def change_password(self, user_id: int, new_password: str) -> bool:
         """Change user's password"""
-        user = self.get_user(user_id)
-        if user:
-            user.set_password(new_password)
-            self.session.commit()
-            return True
-        return False 
\ No newline at end of file
+        with self._session() as session:
+            user = session.query(User).filter_by(id=user_id).first()
+            if user:
+                user.set_password(new_password)
+                session.commit()
+                return True
+            return False
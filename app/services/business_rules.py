@@ -3,29 +3,77 @@ Business rules service for managing call center operations
 """
 
 from datetime import datetime, time, timedelta, date
+from functools import lru_cache
+import time as _time
 import pytz
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 import sqlite3
+import logging
+import threading
+import atexit
+import os
+import queue
+from contextlib import contextmanager
 from pathlib import Path
 
+logger = logging.getLogger(__name__)
+
+# Today's ISO date, reused until local midnight
+_today_cache = {"date": None, "expires_at": 0.0}
+
+def _today_iso() -> str:
+    """Return date.today().isoformat(), recomputed only once the day rolls over"""
+    now = _time.time()
+    cache = _today_cache
+    if now >= cache["expires_at"]:
+        today = date.today()
+        cache["date"] = today.isoformat()
+        cache["expires_at"] = datetime.combine(today + timedelta(days=1), time.min).timestamp()
+    return cache["date"]
+
+@lru_cache(maxsize=64)
+def _tz(name: str):
+    """Resolve a timezone once; pytz lookups take a lock and may hit disk"""
+    return pytz.timezone(name)
+
 class BusinessRulesService:
+    # Common business timezones
+    supported_timezones = {
+        'US/Eastern': 'Eastern Time',
+        'US/Central': 'Central Time',
+        'US/Mountain': 'Mountain Time',
+        'US/Pacific': 'Pacific Time',
+        'Europe/London': 'UK Time',
+        'Europe/Paris': 'Central European Time',
+        'Asia/Tokyo': 'Japan Time',
+        'Australia/Sydney': 'Sydney Time'
+    }
+    
+    # Days from now until the next opening, keyed by (weekday, state) where
+    # state is 0 = before opening, 1 = after closing, 2 = weekend
+    _BEFORE_OPEN, _AFTER_CLOSE, _WEEKEND = 0, 1, 2
+    _NEXT_BUSINESS_OFFSET = {
+        (0, _BEFORE_OPEN): 0, (0, _AFTER_CLOSE): 1,
+        (1, _BEFORE_OPEN): 0, (1, _AFTER_CLOSE): 1,
+        (2, _BEFORE_OPEN): 0, (2, _AFTER_CLOSE): 1,
+        (3, _BEFORE_OPEN): 0, (3, _AFTER_CLOSE): 1,
+        (4, _BEFORE_OPEN): 0, (4, _AFTER_CLOSE): 3,  # Friday evening -> Monday
+        (5, _WEEKEND): 2,
+        (6, _WEEKEND): 1
+    }
+    
     def __init__(self):
         self.business_hours = {
             'start': time(9, 0),  # 9:00 AM
             'end': time(17, 0)    # 5:00 PM
         }
+        # Minutes since midnight, so the hot path compares plain ints
+        self._start_min = self.business_hours['start'].hour * 60 + self.business_hours['start'].minute
+        self._end_min = self.business_hours['end'].hour * 60 + self.business_hours['end'].minute
         
-        # Common business timezones
-        self.supported_timezones = {
-            'US/Eastern': 'Eastern Time',
-            'US/Central': 'Central Time',
-            'US/Mountain': 'Mountain Time',
-            'US/Pacific': 'Pacific Time',
-            'Europe/London': 'UK Time',
-            'Europe/Paris': 'Central European Time',
-            'Asia/Tokyo': 'Japan Time',
-            'Australia/Sydney': 'Sydney Time'
-        }
+        # Warm the timezone cache for the zones the dashboard offers
+        for name in self.supported_timezones:
+            _tz(name)
     
     def is_business_hours(self, timezone_str: str) -> Dict:
         """
@@ -33,57 +81,54 @@ class BusinessRulesService:
         Returns dict with status and next available time
         """
         try:
-            tz = pytz.timezone(timezone_str)
-            current_time = datetime.now(tz)
-            current_time_only = current_time.time()
-            
-            is_business = (
-                self.business_hours['start'] <= current_time_only <= self.business_hours['end'] and
-                current_time.weekday() < 5  # Monday = 0, Friday = 4
+            # Results only change when the minute rolls over, so cache per epoch minute
+            status = self._is_business_hours_at(
+                timezone_str,
+                int(_time.time() // 60),
+                self._start_min,
+                self._end_min
             )
+            return dict(status)
             
-            next_time = None
-            if not is_business:
-                if current_time.weekday() >= 5:  # Weekend
-                    # Next Monday
-                    days_ahead = 7 - current_time.weekday()
-                    next_time = current_time.replace(
-                        hour=self.business_hours['start'].hour,
-                        minute=self.business_hours['start'].minute,
-                        second=0
-                    ) + timedelta(days=days_ahead)
-                elif current_time_only < self.business_hours['start']:
-                    # Later today
-                    next_time = current_time.replace(
-                        hour=self.business_hours['start'].hour,
-                        minute=self.business_hours['start'].minute,
-                        second=0
-                    )
-                else:
-                    # Next business day
-                    next_time = current_time.replace(
-                        hour=self.business_hours['start'].hour,
-                        minute=self.business_hours['start'].minute,
-                        second=0
-                    ) + timedelta(days=1)
-                    if next_time.weekday() >= 5:  # If next day is weekend
-                        next_time = next_time + timedelta(days=(7-next_time.weekday()))
-            
-            return {
-                'is_business_hours': is_business,
-                'current_time': current_time.strftime('%I:%M %p'),
-                'current_day': current_time.strftime('%A'),
-                'next_available': next_time.strftime('%I:%M %p %A') if next_time else None,
-                'timezone_name': self.supported_timezones.get(timezone_str, timezone_str)
-            }
-            
-        except Exception as e:
-            print(f"Error checking business hours: {e}")
+        except pytz.UnknownTimeZoneError:
+            logger.warning("Unknown timezone %r", timezone_str)
             return {
                 'is_business_hours': False,
                 'error': f"Invalid timezone: {timezone_str}"
             }
     
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _is_business_hours_at(timezone_str: str, epoch_minute: int,
+                              start_min: int, end_min: int) -> Dict:
+        """Business-hours status for a timezone at the given minute since the epoch"""
+        tz = _tz(timezone_str)
+        current_time = datetime.fromtimestamp(epoch_minute * 60, tz)
+        current_min = current_time.hour * 60 + current_time.minute
+        weekday = current_time.weekday()  # Monday = 0, Friday = 4
+        
+        is_business = weekday < 5 and start_min <= current_min <= end_min
+        
+        next_time = None
+        if not is_business:
+            # Outside hours on a weekday means before opening or after closing
+            state = (BusinessRulesService._WEEKEND if weekday >= 5
+                     else int(current_min > end_min))
+            start_hour, start_minute = divmod(start_min, 60)
+            next_time = current_time.replace(
+                hour=start_hour,
+                minute=start_minute,
+                second=0
+            ) + timedelta(days=BusinessRulesService._NEXT_BUSINESS_OFFSET[weekday, state])
+        
+        return {
+            'is_business_hours': is_business,
+            'current_time': current_time.strftime('%I:%M %p'),
+            'current_day': current_time.strftime('%A'),
+            'next_available': next_time.strftime('%I:%M %p %A') if next_time else None,
+            'timezone_name': BusinessRulesService.supported_timezones.get(timezone_str, timezone_str)
+        }
+    
     def get_available_timezones(self) -> Dict[str, str]:
         """Get list of supported timezones"""
         return self.supported_timezones
@@ -111,6 +156,22 @@ class BusinessRulesService:
         }
 
 class BusinessRules:
+    # Applied to every connection when it is opened
+    _PRAGMAS = (
+        'PRAGMA journal_mode=WAL',
+        'PRAGMA synchronous=NORMAL',
+        'PRAGMA busy_timeout=5000',
+        'PRAGMA cache_size=-20000',
+        'PRAGMA temp_store=MEMORY'
+    )
+    
+    _TODAYS_CONTRACTS_SQL = '''
+        SELECT business_name, contract_time 
+        FROM daily_contracts 
+        WHERE contract_date = ?
+        ORDER BY contract_time DESC
+    '''
+    
     def __init__(self):
         """Initialize business rules service"""
         self.db_path = self._get_db_path()
@@ -125,12 +186,16 @@ class BusinessRules:
         return str(data_dir / 'business_rules.db')
     
     def _init_db(self):
-        """Initialize the database tables"""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            
+        """Open the writer connection and read pool, and initialize the database tables"""
+        # A single writer serialized by a lock plus a pool of read-only
+        # connections; under WAL, readers never wait on the writer
+        self._conn = self._connect(self.db_path)
+        self._lock = threading.Lock()
+        atexit.register(self.close)
+        
+        with self._writer() as conn:
             # Create contracts table
-            cursor.execute('''
+            conn.execute('''
                 CREATE TABLE IF NOT EXISTS daily_contracts (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
                     contract_date DATE NOT NULL,
@@ -139,8 +204,15 @@ class BusinessRules:
                 )
             ''')
             
+            # Today's contracts are read by date, newest first; business_name is
+            # included so the query is answered from the index alone
+            conn.execute('''
+                CREATE INDEX IF NOT EXISTS idx_contracts_date_time
+                ON daily_contracts (contract_date, contract_time DESC, business_name)
+            ''')
+            
             # Create settings table
-            cursor.execute('''
+            conn.execute('''
                 CREATE TABLE IF NOT EXISTS settings (
                     key TEXT PRIMARY KEY,
                     value TEXT NOT NULL,
@@ -149,12 +221,56 @@ class BusinessRules:
             ''')
             
             # Insert default daily goal if not exists
-            cursor.execute('''
+            conn.execute('''
                 INSERT OR IGNORE INTO settings (key, value, updated_at)
                 VALUES (?, ?, ?)
             ''', ('daily_contract_goal', str(self.daily_contract_goal), datetime.now().isoformat()))
             
-            conn.commit()
+            # The goal only changes through set_daily_goal, so keep it in memory
+            row = conn.execute(
+                'SELECT value FROM settings WHERE key = ?', ('daily_contract_goal',)
+            ).fetchone()
+            self.daily_contract_goal = int(row[0])
+    
+        read_uri = f"file:{self.db_path}?mode=ro&cache=private"
+        self._read_pool = queue.Queue()
+        for _ in range(os.cpu_count() or 1):
+            self._read_pool.put(self._connect(read_uri, uri=True))
+    
+    def _connect(self, database: str, uri: bool = False) -> sqlite3.Connection:
+        """Open an autocommit connection with the service pragmas applied"""
+        conn = sqlite3.connect(database, uri=uri, check_same_thread=False, isolation_level=None)
+        for pragma in self._PRAGMAS:
+            conn.execute(pragma)
+        return conn
+    
+    @contextmanager
+    def _writer(self):
+        """Run statements on the writer connection in one immediate transaction"""
+        with self._lock:
+            self._conn.execute('BEGIN IMMEDIATE')
+            try:
+                yield self._conn
+            except BaseException:
+                self._conn.execute('ROLLBACK')
+                raise
+            self._conn.execute('COMMIT')
+    
+    @contextmanager
+    def _reader(self):
+        """Borrow a read-only connection from the pool"""
+        conn = self._read_pool.get()
+        try:
+            yield conn
+        finally:
+            self._read_pool.put(conn)
+    
+    def close(self):
+        """Close the writer connection and every pooled reader"""
+        with self._lock:
+            self._conn.close()
+        while not self._read_pool.empty():
+            self._read_pool.get_nowait().close()
     
     def set_daily_goal(self, goal: int) -> bool:
         """Set the daily contract goal
@@ -167,18 +283,17 @@ class BusinessRules:
             return False
             
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute('''
+            with self._writer() as conn:
+                conn.execute('''
                     UPDATE settings 
                     SET value = ?, updated_at = ?
                     WHERE key = ?
                 ''', (str(goal), datetime.now().isoformat(), 'daily_contract_goal'))
-                conn.commit()
-                self.daily_contract_goal = goal
-                return True
-        except Exception as e:
-            print(f"Error setting daily goal: {e}")
+            # Only mirror the new goal once the update has committed
+            self.daily_contract_goal = goal
+            return True
+        except sqlite3.Error:
+            logger.warning("Error setting daily goal", exc_info=True)
             return False
     
     def get_daily_goal(self) -> int:
@@ -186,15 +301,7 @@ class BusinessRules:
         Returns:
             int: Current daily goal
         """
-        try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute('SELECT value FROM settings WHERE key = ?', ('daily_contract_goal',))
-                result = cursor.fetchone()
-                return int(result[0]) if result else self.daily_contract_goal
-        except Exception as e:
-            print(f"Error getting daily goal: {e}")
-            return self.daily_contract_goal
+        return self.daily_contract_goal
     
     def add_contract(self, business_name: str) -> bool:
         """Record a new contract
@@ -204,17 +311,36 @@ class BusinessRules:
             bool: True if successful
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                now = datetime.now()
-                cursor.execute('''
+            now = datetime.now()
+            with self._writer() as conn:
+                conn.execute('''
                     INSERT INTO daily_contracts (contract_date, business_name, contract_time)
                     VALUES (?, ?, ?)
                 ''', (now.date().isoformat(), business_name, now.isoformat()))
-                conn.commit()
                 return True
-        except Exception as e:
-            print(f"Error adding contract: {e}")
+        except sqlite3.Error:
+            logger.warning("Error adding contract", exc_info=True)
+            return False
+    
+    def add_contracts_bulk(self, business_names: List[str]) -> bool:
+        """Record several contracts in one transaction
+        Args:
+            business_names (List[str]): Names of the businesses that signed
+        Returns:
+            bool: True if successful
+        """
+        try:
+            now = datetime.now()
+            today = now.date().isoformat()
+            now_iso = now.isoformat()
+            with self._writer() as conn:
+                conn.executemany('''
+                    INSERT INTO daily_contracts (contract_date, business_name, contract_time)
+                    VALUES (?, ?, ?)
+                ''', [(today, name, now_iso) for name in business_names])
+                return True
+        except sqlite3.Error:
+            logger.warning("Error adding contracts", exc_info=True)
             return False
     
     def get_todays_contracts(self) -> list:
@@ -223,31 +349,32 @@ class BusinessRules:
             list: List of contracts for today
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                today = date.today().isoformat()
-                cursor.execute('''
-                    SELECT business_name, contract_time 
-                    FROM daily_contracts 
-                    WHERE contract_date = ?
-                    ORDER BY contract_time DESC
-                ''', (today,))
+            today = _today_iso()
+            with self._reader() as conn:
+                cursor = conn.execute(self._TODAYS_CONTRACTS_SQL, (today,))
                 return cursor.fetchall()
-        except Exception as e:
-            print(f"Error getting today's contracts: {e}")
+        except sqlite3.Error:
+            logger.warning("Error getting today's contracts", exc_info=True)
             return []
     
+    def _todays_contract_count(self) -> int:
+        """Count today's contracts without fetching the rows"""
+        with self._reader() as conn:
+            cursor = conn.execute(
+                'SELECT COUNT(*) FROM daily_contracts WHERE contract_date = ?',
+                (_today_iso(),)
+            )
+            return cursor.fetchone()[0]
+    
     def can_accept_more_contracts(self) -> bool:
         """Check if we can accept more contracts today
         Returns:
             bool: True if we haven't reached the daily goal
         """
         try:
-            today_count = len(self.get_todays_contracts())
-            daily_goal = self.get_daily_goal()
-            return today_count < daily_goal
-        except Exception as e:
-            print(f"Error checking contract limit: {e}")
+            return self._todays_contract_count() < self.get_daily_goal()
+        except sqlite3.Error:
+            logger.warning("Error checking contract limit", exc_info=True)
             return False
     
     def get_daily_stats(self) -> dict:
@@ -256,16 +383,20 @@ class BusinessRules:
             dict: Statistics including goal, current count, and remaining
         """
         try:
-            daily_goal = self.get_daily_goal()
-            today_contracts = self.get_todays_contracts()
+            # The goal is held in memory, leaving a single query for the contracts
+            daily_goal = self.daily_contract_goal
+            with self._reader() as conn:
+                today_contracts = conn.execute(
+                    self._TODAYS_CONTRACTS_SQL, (_today_iso(),)
+                ).fetchall()
             return {
                 'goal': daily_goal,
                 'current': len(today_contracts),
                 'remaining': max(0, daily_goal - len(today_contracts)),
                 'contracts': today_contracts
             }
-        except Exception as e:
-            print(f"Error getting daily stats: {e}")
+        except sqlite3.Error:
+            logger.warning("Error getting daily stats", exc_info=True)
             return {
                 'goal': self.daily_contract_goal,
                 'current': 0,
@@ -1,8 +1,10 @@
-from typing import Dict, Any, List, Optional
-from dataclasses import dataclass
+from typing import Dict, Any, List, Optional, Tuple, Deque
+from collections import deque
+from dataclasses import dataclass, replace
 from datetime import datetime, timedelta
 from enum import Enum
-import uuid
+from types import MappingProxyType
+import secrets
 
 class AmendmentType(Enum):
     SUBSCRIPTION_CHANGE = "subscription_change"
@@ -23,7 +25,11 @@ class AmendmentStatus(Enum):
     EXECUTED = "executed"
     EXPIRED = "expired"
 
-@dataclass
+# Enum member -> value, resolved once instead of through the .value descriptor
+_STATUS_VALUE = {status: status.value for status in AmendmentStatus}
+_TYPE_VALUE = {amendment_type: amendment_type.value for amendment_type in AmendmentType}
+
+@dataclass(frozen=True, slots=True)
 class AmendmentVersion:
     version_id: str
     created_at: datetime
@@ -32,235 +38,281 @@ class AmendmentVersion:
     comments: str
     status: AmendmentStatus
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AmendmentTemplate:
     name: str
     description: str
-    required_approvals: List[str]
+    required_approvals: Tuple[str, ...]
     notice_period: int  # days
-    documentation_requirements: List[str]
+    documentation_requirements: Tuple[str, ...]
     legal_review_required: bool
 
-class ContractAmendmentService:
-    def __init__(self):
-        self.amendment_templates = {
-            AmendmentType.SUBSCRIPTION_CHANGE: AmendmentTemplate(
-                name="Subscription Plan Modification",
-                description="Change in subscription tier or service level",
-                required_approvals=["Sales", "Finance"],
-                notice_period=30,
-                documentation_requirements=[
-                    "Current usage metrics",
-                    "New plan details",
-                    "Price impact analysis"
-                ],
-                legal_review_required=False
-            ),
-            AmendmentType.TERM_EXTENSION: AmendmentTemplate(
-                name="Contract Term Extension",
-                description="Extension of contract duration",
-                required_approvals=["Sales", "Finance", "Legal"],
-                notice_period=60,
-                documentation_requirements=[
-                    "Performance history",
-                    "Updated pricing terms",
-                    "Extension rationale"
-                ],
-                legal_review_required=True
-            ),
-            AmendmentType.SLA_MODIFICATION: AmendmentTemplate(
-                name="Service Level Agreement Update",
-                description="Modification of service level terms",
-                required_approvals=["Operations", "Legal"],
-                notice_period=45,
-                documentation_requirements=[
-                    "Current SLA performance",
-                    "Proposed changes",
-                    "Impact analysis"
-                ],
-                legal_review_required=True
+# Older versions beyond this many are dropped from an amendment's history
+MAX_VERSION_HISTORY = 50
+
+# Templates and workflow rules are constants shared by every service instance
+_AMENDMENT_TEMPLATES = {
+    AmendmentType.SUBSCRIPTION_CHANGE: AmendmentTemplate(
+        name="Subscription Plan Modification",
+        description="Change in subscription tier or service level",
+        required_approvals=("Sales", "Finance"),
+        notice_period=30,
+        documentation_requirements=(
+            "Current usage metrics",
+            "New plan details",
+            "Price impact analysis"
+        ),
+        legal_review_required=False
+    ),
+    AmendmentType.TERM_EXTENSION: AmendmentTemplate(
+        name="Contract Term Extension",
+        description="Extension of contract duration",
+        required_approvals=("Sales", "Finance", "Legal"),
+        notice_period=60,
+        documentation_requirements=(
+            "Performance history",
+            "Updated pricing terms",
+            "Extension rationale"
+        ),
+        legal_review_required=True
+    ),
+    AmendmentType.SLA_MODIFICATION: AmendmentTemplate(
+        name="Service Level Agreement Update",
+        description="Modification of service level terms",
+        required_approvals=("Operations", "Legal"),
+        notice_period=45,
+        documentation_requirements=(
+            "Current SLA performance",
+            "Proposed changes",
+            "Impact analysis"
+        ),
+        legal_review_required=True
+    ),
+    AmendmentType.COMPLIANCE_UPDATE: AmendmentTemplate(
+        name="Compliance Requirement Update",
+        description="Updates to compliance and regulatory terms",
+        required_approvals=("Legal", "Compliance", "Security"),
+        notice_period=30,
+        documentation_requirements=(
+            "Regulatory requirements",
+            "Implementation timeline",
+            "Compliance certificates"
+        ),
+        legal_review_required=True
+    ),
+    AmendmentType.USAGE_EXPANSION: AmendmentTemplate(
+        name="Usage Terms Expansion",
+        description="Expansion of authorized usage scope",
+        required_approvals=("Sales", "Operations"),
+        notice_period=30,
+        documentation_requirements=(
+            "Current usage patterns",
+            "Proposed expansion scope",
+            "Technical requirements"
+        ),
+        legal_review_required=False
+    ),
+    AmendmentType.PRICE_ADJUSTMENT: AmendmentTemplate(
+        name="Price Terms Modification",
+        description="Adjustment to pricing terms",
+        required_approvals=("Sales", "Finance", "Legal"),
+        notice_period=60,
+        documentation_requirements=(
+            "Market analysis",
+            "Cost justification",
+            "Impact assessment"
+        ),
+        legal_review_required=True
+    ),
+    AmendmentType.TERRITORY_EXPANSION: AmendmentTemplate(
+        name="Territory Coverage Extension",
+        description="Expansion of geographic coverage",
+        required_approvals=("Sales", "Operations", "Legal"),
+        notice_period=45,
+        documentation_requirements=(
+            "Market analysis",
+            "Operational capability assessment",
+            "Regulatory compliance verification"
+        ),
+        legal_review_required=True
+    ),
+    AmendmentType.EXCLUSIVITY_MODIFICATION: AmendmentTemplate(
+        name="Exclusivity Terms Modification",
+        description="Changes to exclusivity arrangements",
+        required_approvals=("Sales", "Legal", "Executive"),
+        notice_period=90,
+        documentation_requirements=(
+            "Market impact analysis",
+            "Competition assessment",
+            "Value proposition"
+        ),
+        legal_review_required=True
+    )
+}
+
+# Extended industry requirements
+_INDUSTRY_REQUIREMENTS = {
+    "FINANCIAL": {
+        "additional_approvers": ("Risk Management", "Compliance"),
+        "extended_notice_periods": {
+            AmendmentType.COMPLIANCE_UPDATE: 45,
+            AmendmentType.SLA_MODIFICATION: 60
+        },
+        "additional_documentation": {
+            AmendmentType.COMPLIANCE_UPDATE: (
+                "SOC 2 compliance impact",
+                "Data security assessment"
             ),
-            AmendmentType.COMPLIANCE_UPDATE: AmendmentTemplate(
-                name="Compliance Requirement Update",
-                description="Updates to compliance and regulatory terms",
-                required_approvals=["Legal", "Compliance", "Security"],
-                notice_period=30,
-                documentation_requirements=[
-                    "Regulatory requirements",
-                    "Implementation timeline",
-                    "Compliance certificates"
-                ],
-                legal_review_required=True
+            AmendmentType.USAGE_EXPANSION: (
+                "Transaction monitoring impact",
+                "Regulatory compliance assessment"
+            )
+        }
+    },
+    "HEALTHCARE": {
+        "additional_approvers": ("Privacy Officer", "Medical Compliance"),
+        "extended_notice_periods": {
+            AmendmentType.COMPLIANCE_UPDATE: 60,
+            AmendmentType.USAGE_EXPANSION: 45
+        },
+        "additional_documentation": {
+            AmendmentType.COMPLIANCE_UPDATE: (
+                "HIPAA compliance assessment",
+                "PHI handling procedures"
             ),
-            AmendmentType.USAGE_EXPANSION: AmendmentTemplate(
-                name="Usage Terms Expansion",
-                description="Expansion of authorized usage scope",
-                required_approvals=["Sales", "Operations"],
-                notice_period=30,
-                documentation_requirements=[
-                    "Current usage patterns",
-                    "Proposed expansion scope",
-                    "Technical requirements"
-                ],
-                legal_review_required=False
+            AmendmentType.USAGE_EXPANSION: (
+                "Patient data impact analysis",
+                "Privacy impact assessment"
+            )
+        }
+    },
+    "RETAIL": {
+        "additional_approvers": ("Operations Manager",),
+        "extended_notice_periods": {
+            AmendmentType.USAGE_EXPANSION: 30,
+            AmendmentType.TERRITORY_EXPANSION: 45
+        },
+        "additional_documentation": {
+            AmendmentType.USAGE_EXPANSION: (
+                "Peak season capacity analysis",
+                "Multi-location deployment plan"
             ),
-            AmendmentType.PRICE_ADJUSTMENT: AmendmentTemplate(
-                name="Price Terms Modification",
-                description="Adjustment to pricing terms",
-                required_approvals=["Sales", "Finance", "Legal"],
-                notice_period=60,
-                documentation_requirements=[
-                    "Market analysis",
-                    "Cost justification",
-                    "Impact assessment"
-                ],
-                legal_review_required=True
+            AmendmentType.TERRITORY_EXPANSION: (
+                "Market analysis per location",
+                "Store integration timeline"
+            )
+        }
+    },
+    "MANUFACTURING": {
+        "additional_approvers": ("Production Manager", "Quality Control"),
+        "extended_notice_periods": {
+            AmendmentType.SLA_MODIFICATION: 45,
+            AmendmentType.COMPLIANCE_UPDATE: 30
+        },
+        "additional_documentation": {
+            AmendmentType.SLA_MODIFICATION: (
+                "Production impact analysis",
+                "Quality assurance metrics"
             ),
-            AmendmentType.TERRITORY_EXPANSION: AmendmentTemplate(
-                name="Territory Coverage Extension",
-                description="Expansion of geographic coverage",
-                required_approvals=["Sales", "Operations", "Legal"],
-                notice_period=45,
-                documentation_requirements=[
-                    "Market analysis",
-                    "Operational capability assessment",
-                    "Regulatory compliance verification"
-                ],
-                legal_review_required=True
+            AmendmentType.COMPLIANCE_UPDATE: (
+                "ISO compliance assessment",
+                "Safety protocol updates"
+            )
+        }
+    },
+    "EDUCATION": {
+        "additional_approvers": ("Academic Affairs", "Student Services"),
+        "extended_notice_periods": {
+            AmendmentType.USAGE_EXPANSION: 60,
+            AmendmentType.COMPLIANCE_UPDATE: 45
+        },
+        "additional_documentation": {
+            AmendmentType.USAGE_EXPANSION: (
+                "Student privacy impact",
+                "Academic calendar alignment"
             ),
-            AmendmentType.EXCLUSIVITY_MODIFICATION: AmendmentTemplate(
-                name="Exclusivity Terms Modification",
-                description="Changes to exclusivity arrangements",
-                required_approvals=["Sales", "Legal", "Executive"],
-                notice_period=90,
-                documentation_requirements=[
-                    "Market impact analysis",
-                    "Competition assessment",
-                    "Value proposition"
-                ],
-                legal_review_required=True
+            AmendmentType.COMPLIANCE_UPDATE: (
+                "FERPA compliance assessment",
+                "Accessibility requirements"
             )
         }
+    }
+}
 
-        # Extended industry requirements
-        self.industry_requirements = {
-            "FINANCIAL": {
-                "additional_approvers": ["Risk Management", "Compliance"],
-                "extended_notice_periods": {
-                    AmendmentType.COMPLIANCE_UPDATE: 45,
-                    AmendmentType.SLA_MODIFICATION: 60
-                },
-                "additional_documentation": {
-                    AmendmentType.COMPLIANCE_UPDATE: [
-                        "SOC 2 compliance impact",
-                        "Data security assessment"
-                    ],
-                    AmendmentType.USAGE_EXPANSION: [
-                        "Transaction monitoring impact",
-                        "Regulatory compliance assessment"
-                    ]
-                }
-            },
-            "HEALTHCARE": {
-                "additional_approvers": ["Privacy Officer", "Medical Compliance"],
-                "extended_notice_periods": {
-                    AmendmentType.COMPLIANCE_UPDATE: 60,
-                    AmendmentType.USAGE_EXPANSION: 45
-                },
-                "additional_documentation": {
-                    AmendmentType.COMPLIANCE_UPDATE: [
-                        "HIPAA compliance assessment",
-                        "PHI handling procedures"
-                    ],
-                    AmendmentType.USAGE_EXPANSION: [
-                        "Patient data impact analysis",
-                        "Privacy impact assessment"
-                    ]
-                }
-            },
-            "RETAIL": {
-                "additional_approvers": ["Operations Manager"],
-                "extended_notice_periods": {
-                    AmendmentType.USAGE_EXPANSION: 30,
-                    AmendmentType.TERRITORY_EXPANSION: 45
-                },
-                "additional_documentation": {
-                    AmendmentType.USAGE_EXPANSION: [
-                        "Peak season capacity analysis",
-                        "Multi-location deployment plan"
-                    ],
-                    AmendmentType.TERRITORY_EXPANSION: [
-                        "Market analysis per location",
-                        "Store integration timeline"
-                    ]
-                }
-            },
-            "MANUFACTURING": {
-                "additional_approvers": ["Production Manager", "Quality Control"],
-                "extended_notice_periods": {
-                    AmendmentType.SLA_MODIFICATION: 45,
-                    AmendmentType.COMPLIANCE_UPDATE: 30
-                },
-                "additional_documentation": {
-                    AmendmentType.SLA_MODIFICATION: [
-                        "Production impact analysis",
-                        "Quality assurance metrics"
-                    ],
-                    AmendmentType.COMPLIANCE_UPDATE: [
-                        "ISO compliance assessment",
-                        "Safety protocol updates"
-                    ]
-                }
-            },
-            "EDUCATION": {
-                "additional_approvers": ["Academic Affairs", "Student Services"],
-                "extended_notice_periods": {
-                    AmendmentType.USAGE_EXPANSION: 60,
-                    AmendmentType.COMPLIANCE_UPDATE: 45
-                },
-                "additional_documentation": {
-                    AmendmentType.USAGE_EXPANSION: [
-                        "Student privacy impact",
-                        "Academic calendar alignment"
-                    ],
-                    AmendmentType.COMPLIANCE_UPDATE: [
-                        "FERPA compliance assessment",
-                        "Accessibility requirements"
-                    ]
-                }
-            }
-        }
+def _merge_industry_template(amendment_type: AmendmentType,
+                             template: AmendmentTemplate,
+                             requirements: Dict[str, Any]) -> AmendmentTemplate:
+    """Fold an industry's approvers, notice period and documents into a base template"""
+    return replace(
+        template,
+        required_approvals=template.required_approvals + requirements["additional_approvers"],
+        notice_period=requirements["extended_notice_periods"].get(amendment_type, template.notice_period),
+        documentation_requirements=(
+            template.documentation_requirements +
+            requirements["additional_documentation"].get(amendment_type, ())
+        )
+    )
 
+# Every (amendment type, industry) combination merged once at import
+_MERGED_TEMPLATES = {
+    (amendment_type, industry): _merge_industry_template(amendment_type, template, requirements)
+    for amendment_type, template in _AMENDMENT_TEMPLATES.items()
+    for industry, requirements in _INDUSTRY_REQUIREMENTS.items()
+}
+
+# Workflow configurations
+_WORKFLOW_CONFIGURATIONS = {
+    "parallel_approval_groups": {
+        "standard": (
+            ("Sales", "Operations"),
+            ("Finance", "Compliance")
+        ),
+        "high_value": (
+            ("Sales", "Operations", "Finance"),
+            ("Legal", "Compliance", "Risk Management")
+        ),
+        "executive": (
+            ("CEO", "CFO"),
+            ("Legal", "Board")
+        )
+    },
+    "approval_deadlines": {
+        "standard": 5,
+        "urgent": 2,
+        "extended": 10
+    },
+    "escalation_rules": MappingProxyType({
+        "first_reminder": 48,  # hours
+        "second_reminder": 72,  # hours
+        "auto_escalation": 96   # hours
+    })
+}
+
+class ContractAmendmentService:
+    amendment_templates = _AMENDMENT_TEMPLATES
+    industry_requirements = _INDUSTRY_REQUIREMENTS
+    workflow_configurations = _WORKFLOW_CONFIGURATIONS
+    
+    # (deal value must exceed, approval groups, deadline days), highest tier first
+    _WORKFLOW_TIERS = (
+        (1000000,  # High-value deals
+         _WORKFLOW_CONFIGURATIONS["parallel_approval_groups"]["high_value"],
+         _WORKFLOW_CONFIGURATIONS["approval_deadlines"]["extended"]),
+        (500000,  # Medium-value deals
+         _WORKFLOW_CONFIGURATIONS["parallel_approval_groups"]["standard"],
+         _WORKFLOW_CONFIGURATIONS["approval_deadlines"]["standard"]),
+        (float("-inf"),  # Standard deals
+         _WORKFLOW_CONFIGURATIONS["parallel_approval_groups"]["standard"],
+         _WORKFLOW_CONFIGURATIONS["approval_deadlines"]["standard"])
+    )
+    _ESCALATION_RULES = _WORKFLOW_CONFIGURATIONS["escalation_rules"]
+    
+    def __init__(self):
         # Version history storage
-        self.amendment_versions: Dict[str, List[AmendmentVersion]] = {}
-        
-        # Workflow configurations
-        self.workflow_configurations = {
-            "parallel_approval_groups": {
-                "standard": [
-                    ["Sales", "Operations"],
-                    ["Finance", "Compliance"]
-                ],
-                "high_value": [
-                    ["Sales", "Operations", "Finance"],
-                    ["Legal", "Compliance", "Risk Management"]
-                ],
-                "executive": [
-                    ["CEO", "CFO"],
-                    ["Legal", "Board"]
-                ]
-            },
-            "approval_deadlines": {
-                "standard": 5,
-                "urgent": 2,
-                "extended": 10
-            },
-            "escalation_rules": {
-                "first_reminder": 48,  # hours
-                "second_reminder": 72,  # hours
-                "auto_escalation": 96   # hours
-            }
-        }
+        self.amendment_versions: Dict[str, Deque[AmendmentVersion]] = {}
+        self._latest: Dict[str, AmendmentVersion] = {}
+        # History entries serialized once when stored, parallel to amendment_versions
+        self._serialized_versions: Dict[str, Deque[Dict[str, Any]]] = {}
 
     def generate_amendment(self,
                          amendment_type: AmendmentType,
@@ -269,23 +321,28 @@ class ContractAmendmentService:
                          amendment_details: Dict[str, Any],
                          created_by: str) -> Dict[str, Any]:
         """Generate an amendment template with industry-specific modifications"""
+        # One timestamp for the document, its first version and the history
+        now = datetime.now()
+        now_iso = now.isoformat()
         
         # Generate base amendment
-        amendment = super().generate_amendment(
+        amendment = self._build_base_amendment(
             amendment_type,
             industry,
             current_contract,
-            amendment_details
+            amendment_details,
+            now,
+            now_iso
         )
         
         # Add version tracking
-        version_id = str(uuid.uuid4())
+        version_id = secrets.token_hex(16)
         amendment["version"] = {
             "id": version_id,
             "number": "1.0",
-            "created_at": datetime.now().isoformat(),
+            "created_at": now_iso,
             "created_by": created_by,
-            "status": AmendmentStatus.DRAFT.value
+            "status": _STATUS_VALUE[AmendmentStatus.DRAFT]
         }
         
         # Store initial version
@@ -293,12 +350,13 @@ class ContractAmendmentService:
             amendment["metadata"]["amendment_id"],
             AmendmentVersion(
                 version_id=version_id,
-                created_at=datetime.now(),
+                created_at=now,
                 created_by=created_by,
                 changes=amendment_details,
                 comments="Initial version",
                 status=AmendmentStatus.DRAFT
-            )
+            ),
+            now_iso
         )
         
         # Enhanced workflow based on amendment value and type
@@ -306,6 +364,40 @@ class ContractAmendmentService:
         
         return amendment
 
+    def _build_base_amendment(self,
+                              amendment_type: AmendmentType,
+                              industry: str,
+                              current_contract: Dict[str, Any],
+                              amendment_details: Dict[str, Any],
+                              created_at: datetime,
+                              created_at_iso: str) -> Dict[str, Any]:
+        """Build the amendment document from the pre-merged industry template"""
+        template = _MERGED_TEMPLATES.get(
+            (amendment_type, industry.upper()),
+            self.amendment_templates[amendment_type]
+        )
+        return {
+            "metadata": {
+                "amendment_id": secrets.token_hex(16),
+                "amendment_type": _TYPE_VALUE[amendment_type],
+                "industry": industry,
+                "contract_id": current_contract.get("contract_id"),
+                "created_at": created_at_iso
+            },
+            "template": {
+                "name": template.name,
+                "description": template.description,
+                "notice_period_days": template.notice_period,
+                "effective_date": (created_at + timedelta(days=template.notice_period)).date().isoformat(),
+                "documentation_requirements": list(template.documentation_requirements),
+                "legal_review_required": template.legal_review_required
+            },
+            "details": amendment_details,
+            "approval_workflow": {
+                "required_approvals": list(template.required_approvals)
+            }
+        }
+
     def update_amendment(self,
                         amendment_id: str,
                         changes: Dict[str, Any],
@@ -318,8 +410,11 @@ class ContractAmendmentService:
         if not current_version:
             raise ValueError("Amendment not found")
         
+        now = datetime.now()
+        now_iso = now.isoformat()
+        
         # Create new version
-        new_version_id = str(uuid.uuid4())
+        new_version_id = secrets.token_hex(16)
         new_version_number = self._increment_version(
             current_version.version_id
         )
@@ -327,48 +422,51 @@ class ContractAmendmentService:
         # Store new version
         new_version = AmendmentVersion(
             version_id=new_version_id,
-            created_at=datetime.now(),
+            created_at=now,
             created_by=updated_by,
             changes=changes,
             comments=comments,
             status=AmendmentStatus.DRAFT
         )
         
-        self._store_version(amendment_id, new_version)
+        self._store_version(amendment_id, new_version, now_iso)
         
         return {
             "amendment_id": amendment_id,
             "version_id": new_version_id,
             "version_number": new_version_number,
-            "updated_at": datetime.now().isoformat(),
+            "updated_at": now_iso,
             "updated_by": updated_by,
-            "status": AmendmentStatus.DRAFT.value
+            "status": _STATUS_VALUE[AmendmentStatus.DRAFT]
         }
 
     def get_amendment_history(self, amendment_id: str) -> List[Dict[str, Any]]:
         """Retrieve version history for an amendment"""
-        versions = self.amendment_versions.get(amendment_id, [])
-        return [
-            {
-                "version_id": v.version_id,
-                "created_at": v.created_at.isoformat(),
-                "created_by": v.created_by,
-                "comments": v.comments,
-                "status": v.status.value
-            }
-            for v in versions
-        ]
+        # Shallow copies so callers cannot alter the stored entries
+        return [dict(entry) for entry in self._serialized_versions.get(amendment_id, ())]
 
-    def _store_version(self, amendment_id: str, version: AmendmentVersion):
+    def _store_version(self,
+                       amendment_id: str,
+                       version: AmendmentVersion,
+                       created_at_iso: Optional[str] = None):
         """Store a new version in the history"""
-        if amendment_id not in self.amendment_versions:
-            self.amendment_versions[amendment_id] = []
-        self.amendment_versions[amendment_id].append(version)
+        self.amendment_versions.setdefault(
+            amendment_id, deque(maxlen=MAX_VERSION_HISTORY)
+        ).append(version)
+        self._latest[amendment_id] = version
+        self._serialized_versions.setdefault(
+            amendment_id, deque(maxlen=MAX_VERSION_HISTORY)
+        ).append({
+            "version_id": version.version_id,
+            "created_at": created_at_iso or version.created_at.isoformat(),
+            "created_by": version.created_by,
+            "comments": version.comments,
+            "status": _STATUS_VALUE[version.status]
+        })
 
     def _get_latest_version(self, amendment_id: str) -> Optional[AmendmentVersion]:
         """Get the latest version of an amendment"""
-        versions = self.amendment_versions.get(amendment_id, [])
-        return versions[-1] if versions else None
+        return self._latest.get(amendment_id)
 
     def _increment_version(self, current_version: str) -> str:
         """Increment the version number"""
@@ -380,21 +478,15 @@ class ContractAmendmentService:
         
         # Determine workflow type based on value
         value = details.get('value', 0)
-        if value > 1000000:  # High-value deals
-            approval_groups = self.workflow_configurations["parallel_approval_groups"]["high_value"]
-            deadline = self.workflow_configurations["approval_deadlines"]["extended"]
-        elif value > 500000:  # Medium-value deals
-            approval_groups = self.workflow_configurations["parallel_approval_groups"]["standard"]
-            deadline = self.workflow_configurations["approval_deadlines"]["standard"]
-        else:  # Standard deals
-            approval_groups = self.workflow_configurations["parallel_approval_groups"]["standard"]
-            deadline = self.workflow_configurations["approval_deadlines"]["standard"]
+        for threshold, approval_groups, deadline in self._WORKFLOW_TIERS:
+            if value > threshold:
+                break
 
         # Update workflow configuration
         amendment["approval_workflow"].update({
             "parallel_approval_groups": approval_groups,
             "approval_deadline_days": deadline,
-            "escalation_rules": self.workflow_configurations["escalation_rules"],
+            "escalation_rules": dict(self._ESCALATION_RULES),
             "approval_chain": self._generate_approval_chain(approval_groups)
         })
 
@@ -1,25 +1,33 @@
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Mapping, Tuple, Final
 from dataclasses import dataclass
 from datetime import datetime, timedelta
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from types import MappingProxyType
 import json
+import os
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ComplianceRequirement:
     name: str
     description: str
     certification_needed: bool
     audit_frequency: int  # months
-    reporting_requirements: List[str]
+    reporting_requirements: Tuple[str, ...]
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ServiceLevel:
     name: str
     availability: float
     response_time: int  # minutes
     resolution_time: int  # hours
-    penalties: Dict[str, float]
+    penalties: Mapping[str, float]
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ContractTerms:
     initial_term: int  # months
     auto_renewal_term: int  # months
@@ -28,105 +36,262 @@ class ContractTerms:
     payment_terms: int  # days
     price_increase_cap: float  # percentage
 
-class ContractTemplateService:
-    def __init__(self):
-        # Industry-specific compliance requirements
-        self.compliance_requirements = {
-            "FINANCIAL": [
-                ComplianceRequirement(
-                    name="Data Security",
-                    description="SOC 2 Type II compliance for data handling",
-                    certification_needed=True,
-                    audit_frequency=12,
-                    reporting_requirements=[
-                        "Monthly security reports",
-                        "Incident response documentation",
-                        "Access logs retention"
-                    ]
-                ),
-                ComplianceRequirement(
-                    name="Transaction Monitoring",
-                    description="BSA/AML compliance monitoring",
-                    certification_needed=True,
-                    audit_frequency=6,
-                    reporting_requirements=[
-                        "Suspicious activity reports",
-                        "Transaction monitoring logs",
-                        "Compliance officer review"
-                    ]
-                )
-            ],
-            "HEALTHCARE": [
-                ComplianceRequirement(
-                    name="HIPAA Compliance",
-                    description="Protected Health Information handling",
-                    certification_needed=True,
-                    audit_frequency=6,
-                    reporting_requirements=[
-                        "PHI access logs",
-                        "Security incident reports",
-                        "Patient data handling procedures"
-                    ]
-                ),
-                ComplianceRequirement(
-                    name="Data Privacy",
-                    description="Patient data protection standards",
-                    certification_needed=True,
-                    audit_frequency=12,
-                    reporting_requirements=[
-                        "Privacy impact assessments",
-                        "Data encryption verification",
-                        "Access control documentation"
-                    ]
-                )
-            ]
-        }
+# Template data is static, so it is built once at import and shared
 
-        # Industry-specific SLAs
-        self.service_levels = {
-            "FINANCIAL": ServiceLevel(
-                name="Financial Grade",
-                availability=0.9999,  # 99.99% uptime
-                response_time=5,      # 5 minutes
-                resolution_time=2,    # 2 hours
-                penalties={
-                    "availability": 0.1,  # 10% credit for missing SLA
-                    "response_time": 0.05,
-                    "resolution_time": 0.05
-                }
-            ),
-            "HEALTHCARE": ServiceLevel(
-                name="Healthcare Grade",
-                availability=0.999,   # 99.9% uptime
-                response_time=15,     # 15 minutes
-                resolution_time=4,    # 4 hours
-                penalties={
-                    "availability": 0.15,
-                    "response_time": 0.07,
-                    "resolution_time": 0.07
-                }
+# Industry-specific compliance requirements
+COMPLIANCE_REQUIREMENTS: Final = {
+    "FINANCIAL": (
+        ComplianceRequirement(
+            name="Data Security",
+            description="SOC 2 Type II compliance for data handling",
+            certification_needed=True,
+            audit_frequency=12,
+            reporting_requirements=(
+                "Monthly security reports",
+                "Incident response documentation",
+                "Access logs retention"
             )
-        }
-
-        # Industry-specific contract terms
-        self.default_terms = {
-            "FINANCIAL": ContractTerms(
-                initial_term=36,
-                auto_renewal_term=12,
-                termination_notice=90,
-                early_termination_fee=0.75,
-                payment_terms=30,
-                price_increase_cap=0.05
-            ),
-            "HEALTHCARE": ContractTerms(
-                initial_term=24,
-                auto_renewal_term=12,
-                termination_notice=60,
-                early_termination_fee=0.50,
-                payment_terms=45,
-                price_increase_cap=0.07
+        ),
+        ComplianceRequirement(
+            name="Transaction Monitoring",
+            description="BSA/AML compliance monitoring",
+            certification_needed=True,
+            audit_frequency=6,
+            reporting_requirements=(
+                "Suspicious activity reports",
+                "Transaction monitoring logs",
+                "Compliance officer review"
             )
+        )
+    ),
+    "HEALTHCARE": (
+        ComplianceRequirement(
+            name="HIPAA Compliance",
+            description="Protected Health Information handling",
+            certification_needed=True,
+            audit_frequency=6,
+            reporting_requirements=(
+                "PHI access logs",
+                "Security incident reports",
+                "Patient data handling procedures"
+            )
+        ),
+        ComplianceRequirement(
+            name="Data Privacy",
+            description="Patient data protection standards",
+            certification_needed=True,
+            audit_frequency=12,
+            reporting_requirements=(
+                "Privacy impact assessments",
+                "Data encryption verification",
+                "Access control documentation"
+            )
+        )
+    )
+}
+
+# Industry-specific SLAs
+SERVICE_LEVELS: Final = {
+    "FINANCIAL": ServiceLevel(
+        name="Financial Grade",
+        availability=0.9999,  # 99.99% uptime
+        response_time=5,      # 5 minutes
+        resolution_time=2,    # 2 hours
+        penalties=MappingProxyType({
+            "availability": 0.1,  # 10% credit for missing SLA
+            "response_time": 0.05,
+            "resolution_time": 0.05
+        })
+    ),
+    "HEALTHCARE": ServiceLevel(
+        name="Healthcare Grade",
+        availability=0.999,   # 99.9% uptime
+        response_time=15,     # 15 minutes
+        resolution_time=4,    # 4 hours
+        penalties=MappingProxyType({
+            "availability": 0.15,
+            "response_time": 0.07,
+            "resolution_time": 0.07
+        })
+    )
+}
+
+# Industry-specific contract terms
+DEFAULT_TERMS: Final = {
+    "FINANCIAL": ContractTerms(
+        initial_term=36,
+        auto_renewal_term=12,
+        termination_notice=90,
+        early_termination_fee=0.75,
+        payment_terms=30,
+        price_increase_cap=0.05
+    ),
+    "HEALTHCARE": ContractTerms(
+        initial_term=24,
+        auto_renewal_term=12,
+        termination_notice=60,
+        early_termination_fee=0.50,
+        payment_terms=45,
+        price_increase_cap=0.07
+    )
+}
+
+def _serialize_compliance(requirements: Tuple[ComplianceRequirement, ...]) -> Dict[str, Any]:
+    """Contract form of a compliance requirement set"""
+    return {
+        requirement.name: {
+            "description": requirement.description,
+            "certification_needed": requirement.certification_needed,
+            "audit_frequency_months": requirement.audit_frequency,
+            "reporting_requirements": list(requirement.reporting_requirements)
         }
+        for requirement in requirements
+    }
+
+def _serialize_service_level(service_level: ServiceLevel) -> Dict[str, Any]:
+    """Contract form of a service level"""
+    return {
+        "availability": service_level.availability,
+        "response_time_minutes": service_level.response_time,
+        "resolution_time_hours": service_level.resolution_time,
+        "penalties": dict(service_level.penalties)
+    }
+
+def _serialize_terms(terms: ContractTerms) -> Dict[str, Any]:
+    """Date-independent contract form of a set of terms"""
+    return {
+        "initial_term_months": terms.initial_term,
+        "auto_renewal_term": terms.auto_renewal_term,
+        "termination_notice_days": terms.termination_notice,
+        "early_termination_fee": terms.early_termination_fee,
+        "payment_terms_days": terms.payment_terms,
+        "price_increase_cap": terms.price_increase_cap
+    }
+
+# Serialized terms blocks; contracts copy their scalar fields
+_TERMS_SERIALIZED: Final = {
+    industry: _serialize_terms(terms)
+    for industry, terms in DEFAULT_TERMS.items()
+}
+
+# Usage and data handling terms with the industry extensions already applied;
+# only the subscription-dependent usage limits are built per contract
+_USAGE_AUTHORIZED: Final = (
+    "Outbound sales calls",
+    "Lead qualification",
+    "Appointment setting",
+    "Follow-up calls"
+)
+_USAGE_PROHIBITED: Final = (
+    "Unauthorized data collection",
+    "Competitive analysis",
+    "System reverse engineering"
+)
+_USAGE_TERMS: Final = {
+    "_DEFAULT": {
+        "authorized_use": _USAGE_AUTHORIZED,
+        "prohibited_use": _USAGE_PROHIBITED,
+        "data_retention": "90 days"
+    },
+    "FINANCIAL": {
+        "authorized_use": _USAGE_AUTHORIZED + (
+            "Regulatory compliance checks",
+            "Transaction verification"
+        ),
+        "prohibited_use": _USAGE_PROHIBITED,
+        "data_retention": "7 years"
+    },
+    "HEALTHCARE": {
+        "authorized_use": _USAGE_AUTHORIZED + (
+            "Patient appointment scheduling",
+            "Insurance verification"
+        ),
+        "prohibited_use": _USAGE_PROHIBITED + ("PHI sharing",),
+        "data_retention": "6 years"
+    }
+}
+
+_DATA_CLASSIFICATION: Final = ("Public", "Internal", "Confidential")
+_SECURITY_MEASURES: Final = (
+    "Encryption at rest",
+    "Encryption in transit",
+    "Access controls",
+    "Audit logging"
+)
+_DATA_HANDLING_TERMS: Final = {
+    "_DEFAULT": {
+        "data_classification": _DATA_CLASSIFICATION,
+        "security_measures": _SECURITY_MEASURES,
+        "backup_frequency": "Daily",
+        "retention_period": "90 days"
+    },
+    "FINANCIAL": {
+        "data_classification": _DATA_CLASSIFICATION + ("Regulated",),
+        "security_measures": _SECURITY_MEASURES + (
+            "Multi-factor authentication",
+            "Real-time monitoring",
+            "Fraud detection"
+        ),
+        "backup_frequency": "Daily",
+        "retention_period": "7 years"
+    },
+    "HEALTHCARE": {
+        "data_classification": _DATA_CLASSIFICATION + (
+            "PHI",
+            "Electronic Health Records"
+        ),
+        "security_measures": _SECURITY_MEASURES + (
+            "HIPAA compliance",
+            "PHI encryption",
+            "Access tracking"
+        ),
+        "backup_frequency": "Daily",
+        "retention_period": "6 years"
+    }
+}
+
+def _serialize_term_block(block: Dict[str, Any]) -> Dict[str, Any]:
+    """Fresh contract copy of a usage or data handling block, tuples as lists"""
+    return {
+        key: list(value) if isinstance(value, tuple) else value
+        for key, value in block.items()
+    }
+
+def encode_contract(contract: Dict[str, Any]) -> bytes:
+    """Serialize a generated contract to compact JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(contract)
+    return json.dumps(contract, separators=(",", ":")).encode()
+
+# Pre-encoded JSON for the static contract blocks, spliced by generate_contract_json
+_COMPLIANCE_JSON: Final = {
+    industry: encode_contract(_serialize_compliance(requirements))
+    for industry, requirements in COMPLIANCE_REQUIREMENTS.items()
+}
+_SERVICE_LEVELS_JSON: Final = {
+    industry: encode_contract(_serialize_service_level(service_level))
+    for industry, service_level in SERVICE_LEVELS.items()
+}
+_DATA_HANDLING_JSON: Final = {
+    industry: encode_contract(block) for industry, block in _DATA_HANDLING_TERMS.items()
+}
+
+# Up to this many contracts, worker start-up and pickling cost more than they save
+_BULK_PROCESS_THRESHOLD: Final = 100
+
+def _generate_contract_from_request(request: Dict[str, Any]) -> Dict[str, Any]:
+    """Process-pool entry point; the template tables are already module globals"""
+    return ContractTemplateService().generate_contract(
+        request["industry"],
+        request["company_info"],
+        request["subscription_details"],
+        request.get("custom_terms")
+    )
+
+class ContractTemplateService:
+    compliance_requirements = COMPLIANCE_REQUIREMENTS
+    service_levels = SERVICE_LEVELS
+    default_terms = DEFAULT_TERMS
 
     def generate_contract(self,
                          industry: str,
@@ -135,31 +300,76 @@ class ContractTemplateService:
                          custom_terms: Dict[str, Any] = None) -> Dict[str, Any]:
         """Generate industry-specific contract"""
         
-        # Get base templates
-        compliance_reqs = self.compliance_requirements.get(
-            industry.upper(),
-            self.compliance_requirements["FINANCIAL"]  # Default to financial
-        )
+        industry_key = industry.upper()
+        contract, terms = self._contract_head(industry, industry_key, company_info, custom_terms)
+        contract.update({
+            # Built fresh per contract so callers can edit their copy
+            "service_levels": _serialize_service_level(
+                self.service_levels.get(industry_key) or self.service_levels["FINANCIAL"]  # Default to financial
+            ),
+            "compliance": _serialize_compliance(
+                self.compliance_requirements.get(industry_key)
+                or self.compliance_requirements["FINANCIAL"]  # Default to financial
+            ),
+            "subscription": subscription_details,
+            "usage_terms": self._generate_usage_terms(industry_key, subscription_details),
+            "data_handling": self._generate_data_handling_terms(industry_key),
+            "termination": self._generate_termination_terms(terms)
+        })
         
-        service_level = self.service_levels.get(
-            industry.upper(),
-            self.service_levels["FINANCIAL"]  # Default to financial
-        )
+        return contract
+
+    def generate_contract_json(self,
+                              industry: str,
+                              company_info: Dict[str, Any],
+                              subscription_details: Dict[str, Any],
+                              custom_terms: Dict[str, Any] = None) -> bytes:
+        """Generate an industry-specific contract directly as JSON bytes
         
-        terms = self.default_terms.get(
-            industry.upper(),
-            self.default_terms["FINANCIAL"]  # Default to financial
-        )
+        Same content as encode_contract(generate_contract(...)), but the static
+        blocks are spliced in from pre-encoded fragments instead of being
+        re-serialized for every contract.
+        """
+        industry_key = industry.upper()
+        head, terms = self._contract_head(industry, industry_key, company_info, custom_terms)
+        return b"".join((
+            encode_contract(head)[:-1],  # Reopen the object after the terms block
+            b',"service_levels":',
+            _SERVICE_LEVELS_JSON.get(industry_key) or _SERVICE_LEVELS_JSON["FINANCIAL"],
+            b',"compliance":',
+            _COMPLIANCE_JSON.get(industry_key) or _COMPLIANCE_JSON["FINANCIAL"],
+            b',"subscription":',
+            encode_contract(subscription_details),
+            b',"usage_terms":',
+            encode_contract(self._generate_usage_terms(industry_key, subscription_details)),
+            b',"data_handling":',
+            _DATA_HANDLING_JSON.get(industry_key) or _DATA_HANDLING_JSON["_DEFAULT"],
+            b',"termination":',
+            self._termination_json(terms),
+            b"}"
+        ))
+
+    def _contract_head(self,
+                       industry: str,
+                       industry_key: str,
+                       company_info: Dict[str, Any],
+                       custom_terms: Dict[str, Any] = None) -> Tuple[Dict[str, Any], ContractTerms]:
+        """Build the metadata, parties and terms blocks; returns them with the resolved terms"""
+        # Get base templates
+        terms = self.default_terms.get(industry_key) or self.default_terms["FINANCIAL"]
         
         # Override with custom terms if provided
         if custom_terms:
             terms = self._merge_custom_terms(terms, custom_terms)
+            terms_block = _serialize_terms(terms)
+        else:
+            terms_block = _TERMS_SERIALIZED.get(industry_key) or _TERMS_SERIALIZED["FINANCIAL"]
         
         # Calculate dates
         start_date = datetime.now() + timedelta(days=14)  # Default 2 weeks setup
         initial_term_end = start_date + timedelta(days=terms.initial_term * 30)
         
-        contract = {
+        head = {
             "metadata": {
                 "industry": industry,
                 "generated_date": datetime.now().isoformat(),
@@ -176,35 +386,27 @@ class ContractTemplateService:
             "terms": {
                 "start_date": start_date.isoformat(),
                 "initial_term_end": initial_term_end.isoformat(),
-                "initial_term_months": terms.initial_term,
-                "auto_renewal_term": terms.auto_renewal_term,
-                "termination_notice_days": terms.termination_notice,
-                "early_termination_fee": terms.early_termination_fee,
-                "payment_terms_days": terms.payment_terms,
-                "price_increase_cap": terms.price_increase_cap
-            },
-            "service_levels": {
-                "availability": service_level.availability,
-                "response_time_minutes": service_level.response_time,
-                "resolution_time_hours": service_level.resolution_time,
-                "penalties": service_level.penalties
-            },
-            "compliance": {
-                requirement.name: {
-                    "description": requirement.description,
-                    "certification_needed": requirement.certification_needed,
-                    "audit_frequency_months": requirement.audit_frequency,
-                    "reporting_requirements": requirement.reporting_requirements
-                }
-                for requirement in compliance_reqs
-            },
-            "subscription": subscription_details,
-            "usage_terms": self._generate_usage_terms(industry, subscription_details),
-            "data_handling": self._generate_data_handling_terms(industry),
-            "termination": self._generate_termination_terms(terms)
+                **terms_block
+            }
         }
+        return head, terms
+
+    def generate_contracts_bulk(self, requests: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Generate many independent contracts, in parallel for large batches
         
-        return contract
+        Each request holds the generate_contract arguments: industry,
+        company_info, subscription_details and optionally custom_terms.
+        """
+        if len(requests) <= _BULK_PROCESS_THRESHOLD:
+            return [_generate_contract_from_request(request) for request in requests]
+        
+        workers = os.cpu_count() or 1
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(
+                _generate_contract_from_request,
+                requests,
+                chunksize=max(1, len(requests) // (workers * 4))
+            ))
 
     def _merge_custom_terms(self,
                           base_terms: ContractTerms,
@@ -221,90 +423,34 @@ class ContractTemplateService:
         )
 
     def _generate_usage_terms(self,
-                            industry: str,
+                            industry_key: str,
                             subscription: Dict[str, Any]) -> Dict[str, Any]:
-        """Generate industry-specific usage terms"""
-        base_terms = {
-            "authorized_use": [
-                "Outbound sales calls",
-                "Lead qualification",
-                "Appointment setting",
-                "Follow-up calls"
-            ],
-            "prohibited_use": [
-                "Unauthorized data collection",
-                "Competitive analysis",
-                "System reverse engineering"
-            ],
-            "data_retention": "90 days",
+        """Generate industry-specific usage terms (industry_key is upper-cased)"""
+        return _serialize_term_block(
+            _USAGE_TERMS.get(industry_key) or _USAGE_TERMS["_DEFAULT"]
+        ) | {
             "usage_limits": {
                 "max_calls_per_month": subscription.get("max_calls", 0),
                 "max_concurrent_calls": subscription.get("max_concurrent", 10),
                 "operating_hours": "24/7"
             }
         }
-        
-        # Add industry-specific terms
-        if industry.upper() == "FINANCIAL":
-            base_terms["authorized_use"].extend([
-                "Regulatory compliance checks",
-                "Transaction verification"
-            ])
-            base_terms["data_retention"] = "7 years"
-        
-        elif industry.upper() == "HEALTHCARE":
-            base_terms["authorized_use"].extend([
-                "Patient appointment scheduling",
-                "Insurance verification"
-            ])
-            base_terms["prohibited_use"].append("PHI sharing")
-            base_terms["data_retention"] = "6 years"
-        
-        return base_terms
 
-    def _generate_data_handling_terms(self, industry: str) -> Dict[str, Any]:
-        """Generate industry-specific data handling terms"""
-        base_terms = {
-            "data_classification": [
-                "Public",
-                "Internal",
-                "Confidential"
-            ],
-            "security_measures": [
-                "Encryption at rest",
-                "Encryption in transit",
-                "Access controls",
-                "Audit logging"
-            ],
-            "backup_frequency": "Daily",
-            "retention_period": "90 days"
-        }
-        
-        if industry.upper() == "FINANCIAL":
-            base_terms["data_classification"].append("Regulated")
-            base_terms["security_measures"].extend([
-                "Multi-factor authentication",
-                "Real-time monitoring",
-                "Fraud detection"
-            ])
-            base_terms["retention_period"] = "7 years"
-        
-        elif industry.upper() == "HEALTHCARE":
-            base_terms["data_classification"].extend([
-                "PHI",
-                "Electronic Health Records"
-            ])
-            base_terms["security_measures"].extend([
-                "HIPAA compliance",
-                "PHI encryption",
-                "Access tracking"
-            ])
-            base_terms["retention_period"] = "6 years"
-        
-        return base_terms
+    def _generate_data_handling_terms(self, industry_key: str) -> Dict[str, Any]:
+        """Generate industry-specific data handling terms (industry_key is upper-cased)"""
+        return _serialize_term_block(
+            _DATA_HANDLING_TERMS.get(industry_key) or _DATA_HANDLING_TERMS["_DEFAULT"]
+        )
+
+    @staticmethod
+    @lru_cache(maxsize=16)
+    def _termination_json(terms: ContractTerms) -> bytes:
+        """Pre-encoded termination block for generate_contract_json (cached per frozen ContractTerms)"""
+        return encode_contract(ContractTemplateService._generate_termination_terms(terms))
 
-    def _generate_termination_terms(self, terms: ContractTerms) -> Dict[str, Any]:
-        """Generate termination-related terms"""
+    @staticmethod
+    def _generate_termination_terms(terms: ContractTerms) -> Dict[str, Any]:
+        """Generate termination-related terms (a fresh dict per contract)"""
         return {
             "notice_period_days": terms.termination_notice,
             "early_termination_fee": f"{terms.early_termination_fee * 100}% of remaining contract value",
@@ -1,15 +1,36 @@
 from typing import Dict, Any, List
 from dataclasses import dataclass
-from decimal import Decimal
+from bisect import bisect_left
+import numpy as np
+try:
+    from numba import njit
+except ImportError:
+    njit = None
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SubscriptionTier:
     name: str
     max_calls: int
-    price_per_month: Decimal
-    setup_fee: Decimal
+    price_per_month: float
+    setup_fee: float
     features: List[str]
 
+if njit is not None:
+    @njit(cache=True)
+    def _cost_rows(num_agents, calls_per_month, agent_salary, benefits_multiplier,
+                   overhead, monthly_turnover, out):
+        """Fill one row of monthly cost figures per scenario"""
+        for i in range(num_agents.shape[0]):
+            monthly_salary = (agent_salary[i] * benefits_multiplier) / 12
+            total = num_agents[i] * (monthly_salary + overhead + monthly_turnover)
+            out[i, 0] = total
+            out[i, 1] = total / calls_per_month[i] if calls_per_month[i] > 0 else 0.0
+            out[i, 2] = monthly_salary * num_agents[i]
+            out[i, 3] = overhead * num_agents[i]
+            out[i, 4] = monthly_turnover * num_agents[i]
+else:
+    _cost_rows = None
+
 class CostAnalysisService:
     def __init__(self):
         # Average costs in call center industry
@@ -26,8 +47,8 @@ class CostAnalysisService:
             SubscriptionTier(
                 name="Starter",
                 max_calls=1000,
-                price_per_month=Decimal("450"),  # $0.45 per call
-                setup_fee=Decimal("1000"),
+                price_per_month=450.0,  # $0.45 per call
+                setup_fee=1000.0,
                 features=[
                     "AI-powered outbound calls",
                     "Basic analytics dashboard",
@@ -38,8 +59,8 @@ class CostAnalysisService:
             SubscriptionTier(
                 name="Professional",
                 max_calls=5000,
-                price_per_month=Decimal("2000"),  # $0.40 per call
-                setup_fee=Decimal("2500"),
+                price_per_month=2000.0,  # $0.40 per call
+                setup_fee=2500.0,
                 features=[
                     "All Starter features",
                     "24/7 call availability",
@@ -52,8 +73,8 @@ class CostAnalysisService:
             SubscriptionTier(
                 name="Enterprise",
                 max_calls=10000,
-                price_per_month=Decimal("3500"),  # $0.35 per call
-                setup_fee=Decimal("5000"),
+                price_per_month=3500.0,  # $0.35 per call
+                setup_fee=5000.0,
                 features=[
                     "All Professional features",
                     "Dedicated account manager",
@@ -67,8 +88,8 @@ class CostAnalysisService:
             SubscriptionTier(
                 name="Ultimate",
                 max_calls=25000,
-                price_per_month=Decimal("7500"),  # $0.30 per call
-                setup_fee=Decimal("10000"),
+                price_per_month=7500.0,  # $0.30 per call
+                setup_fee=10000.0,
                 features=[
                     "All Enterprise features",
                     "Multi-language support",
@@ -80,6 +101,15 @@ class CostAnalysisService:
                 ]
             )
         ]
+        
+        # Tiers ordered by call cap, with the cheapest tier covering each cap
+        # onwards, so a recommendation is a single bisect
+        self.subscription_tiers.sort(key=lambda tier: tier.max_calls)
+        self._tier_caps = [tier.max_calls for tier in self.subscription_tiers]
+        self._cheapest_from = self.subscription_tiers[:]
+        for i in range(len(self._cheapest_from) - 2, -1, -1):
+            if self._cheapest_from[i + 1].price_per_month < self._cheapest_from[i].price_per_month:
+                self._cheapest_from[i] = self._cheapest_from[i + 1]
     
     def analyze_current_costs(self, 
                             num_agents: int,
@@ -108,17 +138,55 @@ class CostAnalysisService:
             }
         }
     
+    def analyze_current_costs_batch(self,
+                                    num_agents: np.ndarray,
+                                    calls_per_month: np.ndarray,
+                                    avg_agent_salary: np.ndarray = None) -> Dict[str, Any]:
+        """Vectorized analyze_current_costs over broadcastable scenario arrays"""
+        if avg_agent_salary is None:
+            avg_agent_salary = self.avg_agent_salary
+        agents, calls, salary = np.broadcast_arrays(
+            np.asarray(num_agents, dtype=np.float64),
+            np.asarray(calls_per_month, dtype=np.float64),
+            np.asarray(avg_agent_salary, dtype=np.float64)
+        )
+        shape = agents.shape
+        agents, calls, salary = agents.ravel(), calls.ravel(), salary.ravel()
+        monthly_turnover = (self.avg_turnover_cost * self.avg_turnover_rate) / 12
+        
+        out = np.empty((agents.shape[0], 5))
+        if _cost_rows is not None:
+            _cost_rows(agents, calls, salary, self.avg_benefits_multiplier,
+                       float(self.avg_overhead_per_agent), monthly_turnover, out)
+        else:
+            monthly_salary = (salary * self.avg_benefits_multiplier) / 12
+            out[:, 0] = agents * (monthly_salary + self.avg_overhead_per_agent + monthly_turnover)
+            np.divide(out[:, 0], calls, out=out[:, 1], where=calls > 0)
+            out[calls <= 0, 1] = 0.0
+            out[:, 2] = monthly_salary * agents
+            out[:, 3] = self.avg_overhead_per_agent * agents
+            out[:, 4] = monthly_turnover * agents
+        
+        out = out.reshape(shape + (5,))
+        return {
+            "total_monthly_cost": np.round(out[..., 0], 2),
+            "cost_per_call": np.round(out[..., 1], 2),
+            "annual_cost": np.round(out[..., 0] * 12, 2),
+            "breakdown": {
+                "salary_benefits": np.round(out[..., 2], 2),
+                "overhead": np.round(out[..., 3], 2),
+                "turnover": np.round(out[..., 4], 2)
+            }
+        }
+    
     def recommend_subscription(self, current_monthly_calls: int, current_monthly_cost: float) -> Dict[str, Any]:
         """Recommend the best subscription tier based on usage and cost"""
         target_monthly_cost = current_monthly_cost * 0.5  # Aim for 50% cost reduction
         
-        # Find suitable tier based on call volume
-        suitable_tiers = [
-            tier for tier in self.subscription_tiers 
-            if tier.max_calls >= current_monthly_calls
-        ]
+        # Find the first tier whose call cap covers the volume
+        i = bisect_left(self._tier_caps, current_monthly_calls)
         
-        if not suitable_tiers:
+        if i == len(self._tier_caps):
             return {
                 "recommendation": "Custom Enterprise Solution",
                 "message": "Your call volume exceeds our standard tiers. We'll create a custom solution.",
@@ -126,11 +194,11 @@ class CostAnalysisService:
             }
         
         # Get the most cost-effective tier
-        recommended_tier = min(suitable_tiers, key=lambda x: x.price_per_month)
+        recommended_tier = self._cheapest_from[i]
         
-        monthly_savings = current_monthly_cost - float(recommended_tier.price_per_month)
+        monthly_savings = current_monthly_cost - recommended_tier.price_per_month
         annual_savings = monthly_savings * 12
-        roi_months = float(recommended_tier.setup_fee) / monthly_savings if monthly_savings > 0 else 0
+        roi_months = recommended_tier.setup_fee / monthly_savings if monthly_savings > 0 else 0
         
         return {
             "recommendation": recommended_tier,
@@ -144,19 +212,21 @@ class CostAnalysisService:
                             current_costs: Dict[str, float],
                             selected_tier: SubscriptionTier) -> Dict[str, Any]:
         """Calculate detailed ROI metrics for the selected tier"""
-        monthly_savings = current_costs["total_monthly_cost"] - float(selected_tier.price_per_month)
+        current_monthly_cost = current_costs["total_monthly_cost"]
+        setup_fee = selected_tier.setup_fee
+        monthly_savings = current_monthly_cost - selected_tier.price_per_month
         annual_savings = monthly_savings * 12
         
         return {
             "monthly_savings": round(monthly_savings, 2),
             "annual_savings": round(annual_savings, 2),
-            "setup_fee": float(selected_tier.setup_fee),
+            "setup_fee": setup_fee,
             "roi_metrics": {
-                "payback_period_months": round(float(selected_tier.setup_fee) / monthly_savings, 1),
-                "first_year_savings": round(annual_savings - float(selected_tier.setup_fee), 2),
-                "five_year_savings": round((annual_savings * 5) - float(selected_tier.setup_fee), 2),
+                "payback_period_months": round(setup_fee / monthly_savings, 1),
+                "first_year_savings": round(annual_savings - setup_fee, 2),
+                "five_year_savings": round((annual_savings * 5) - setup_fee, 2),
                 "cost_reduction_percentage": round(
-                    (monthly_savings / current_costs["total_monthly_cost"]) * 100, 1
+                    (monthly_savings / current_monthly_cost) * 100, 1
                 )
             },
             "operational_benefits": [
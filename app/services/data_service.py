@@ -1,10 +1,61 @@
-from sqlalchemy import create_engine, text
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.engine import make_url
 from sqlalchemy.orm import sessionmaker
 import pandas as pd
+import numpy as np
 from datetime import datetime, timedelta
 import os
 from typing import Dict, List, Optional
-import random
+
+# Statements are compiled once and reused by every DataService call
+_Q_TABLE_EXISTS = text(
+    "SELECT name FROM sqlite_master WHERE type='table' AND name='calls'"
+)
+_Q_DAILY = text("""
+    SELECT
+        DATE(timestamp) as date,
+        COUNT(*) as total_calls,
+        AVG(status = 'completed') as success_rate,
+        AVG(duration) as avg_duration
+    FROM calls
+    WHERE timestamp >= :start_date
+    GROUP BY DATE(timestamp)
+    ORDER BY date
+""")
+_Q_CURRENT_DAY = text("""
+    SELECT
+        COUNT(*) as total_calls,
+        AVG(status = 'completed') as success_rate,
+        AVG(duration) as avg_duration
+    FROM calls
+    WHERE DATE(timestamp) = DATE('now')
+""")
+_Q_HOURLY = text("""
+    SELECT
+        STRFTIME('%H', timestamp) as hour,
+        COUNT(*) as call_count,
+        AVG(status = 'completed') as success_rate
+    FROM calls
+    WHERE timestamp >= DATE('now', '-7 days')
+    GROUP BY STRFTIME('%H', timestamp)
+    ORDER BY hour
+""")
+_Q_CREATE_CALLS = text("""
+    CREATE TABLE IF NOT EXISTS calls (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        timestamp DATETIME,
+        duration INTEGER,
+        status TEXT,
+        phone_number TEXT,
+        agent_id INTEGER
+    )
+""")
+_Q_CREATE_TS_INDEX = text("CREATE INDEX IF NOT EXISTS idx_calls_ts ON calls(timestamp)")
+_Q_COUNT_CALLS = text("SELECT COUNT(*) FROM calls")
+_INSERT_CALLS_SQL = (
+    "INSERT INTO calls (timestamp, duration, status, phone_number, agent_id) "
+    "VALUES (?, ?, ?, ?, ?)"
+)
 
 class DataService:
     def __init__(self, connection_string: Optional[str] = None):
@@ -22,11 +73,16 @@ class DataService:
             connection_string = f'sqlite:///{db_path}'
         
         try:
-            self.engine = create_engine(connection_string)
+            url = make_url(connection_string)
+            # SQLite file databases are pooled by default (QueuePool, with
+            # check_same_thread off), so connections persist across queries
+            self.engine = create_engine(url)
+            if self.engine.dialect.name == 'sqlite':
+                event.listen(self.engine, 'connect', self._configure_connection)
             # Test the connection
             with self.engine.connect() as conn:
                 conn.execute(text("SELECT 1"))
-            print(f"Successfully connected to database at: {db_path}")
+            print(f"Successfully connected to database at: {url.database or url.render_as_string(hide_password=True)}")
         except Exception as e:
             print(f"Error connecting to database: {e}")
             raise
@@ -34,39 +90,32 @@ class DataService:
         Session = sessionmaker(bind=self.engine)
         self.session = Session()
 
+    @staticmethod
+    def _configure_connection(dbapi_connection, connection_record):
+        """Apply SQLite pragmas to every new pooled connection"""
+        cursor = dbapi_connection.cursor()
+        cursor.execute('PRAGMA journal_mode=WAL')
+        cursor.execute('PRAGMA synchronous=NORMAL')
+        cursor.close()
+
     def verify_database(self) -> bool:
         """Verify database exists and has the correct schema"""
         try:
             with self.engine.connect() as conn:
                 # Check if calls table exists
-                result = conn.execute(text(
-                    "SELECT name FROM sqlite_master WHERE type='table' AND name='calls'"
-                ))
+                result = conn.execute(_Q_TABLE_EXISTS)
                 return bool(result.scalar())
         except Exception:
             return False
 
     def get_daily_calls(self, days: int = 30) -> pd.DataFrame:
         """Get daily call statistics for the specified number of days"""
-        query = text("""
-            SELECT 
-                DATE(timestamp) as date,
-                COUNT(*) as total_calls,
-                AVG(CASE WHEN status = 'completed' THEN 1 ELSE 0 END) as success_rate,
-                AVG(duration) as avg_duration
-            FROM calls
-            WHERE timestamp >= :start_date
-            GROUP BY DATE(timestamp)
-            ORDER BY date
-        """)
-        
         start_date = datetime.now() - timedelta(days=days)
         
         try:
             with self.engine.connect() as conn:
-                result = conn.execute(query, {"start_date": start_date})
-                df = pd.DataFrame(result.fetchall(), columns=['date', 'total_calls', 'success_rate', 'avg_duration'])
-                return df
+                return pd.read_sql_query(_Q_DAILY, conn, params={"start_date": start_date},
+                                         parse_dates=['date'])
         except Exception as e:
             print(f"Error fetching daily calls: {e}")
             # Return sample data if database is not available
@@ -74,18 +123,9 @@ class DataService:
 
     def get_current_day_stats(self) -> Dict:
         """Get statistics for the current day"""
-        query = text("""
-            SELECT 
-                COUNT(*) as total_calls,
-                AVG(CASE WHEN status = 'completed' THEN 1 ELSE 0 END) as success_rate,
-                AVG(duration) as avg_duration
-            FROM calls
-            WHERE DATE(timestamp) = DATE('now')
-        """)
-        
         try:
             with self.engine.connect() as conn:
-                result = conn.execute(query)
+                result = conn.execute(_Q_CURRENT_DAY)
                 row = result.fetchone()
                 return {
                     'total_calls': row[0] if row[0] else 0,
@@ -95,40 +135,33 @@ class DataService:
         except Exception as e:
             print(f"Error fetching current day stats: {e}")
             # Return sample data if database is not available
-            sample = self._generate_sample_data(1)
-            return {
-                'total_calls': sample['calls'].iloc[-1],
-                'success_rate': sample['success_rate'].iloc[-1],
-                'avg_duration': sample['avg_duration'].iloc[-1]
-            }
+            return self._sample_scalar_stats()
 
     def get_hourly_distribution(self) -> pd.DataFrame:
         """Get call distribution by hour"""
-        query = text("""
-            SELECT 
-                STRFTIME('%H', timestamp) as hour,
-                COUNT(*) as call_count,
-                AVG(CASE WHEN status = 'completed' THEN 1 ELSE 0 END) as success_rate
-            FROM calls
-            WHERE timestamp >= DATE('now', '-7 days')
-            GROUP BY STRFTIME('%H', timestamp)
-            ORDER BY hour
-        """)
-        
         try:
             with self.engine.connect() as conn:
-                result = conn.execute(query)
-                return pd.DataFrame(result.fetchall(), columns=['hour', 'call_count', 'success_rate'])
+                return pd.read_sql_query(_Q_HOURLY, conn)
         except Exception as e:
             print(f"Error fetching hourly distribution: {e}")
             # Return sample hourly data
-            hours = range(24)
+            hours = np.arange(24)
+            peak = 12 - np.abs(12 - hours)
             return pd.DataFrame({
                 'hour': hours,
-                'call_count': [100 + h * 10 + (12 - abs(12 - h)) * 20 for h in hours],
-                'success_rate': [0.7 + (12 - abs(12 - h)) * 0.01 for h in hours]
+                'call_count': 100 + hours * 10 + peak * 20,
+                'success_rate': 0.7 + peak * 0.01
             })
 
+    @staticmethod
+    def _sample_scalar_stats() -> Dict:
+        """Sample stats for a single day (day 0 of _generate_sample_data)"""
+        return {
+            'total_calls': 100,
+            'success_rate': 0.75,
+            'avg_duration': 180
+        }
+
     def _generate_sample_data(self, days: int) -> pd.DataFrame:
         """Generate sample data for testing"""
         dates = pd.date_range(
@@ -136,69 +169,50 @@ class DataService:
             end=datetime.now(),
             freq='D'
         )
+        i = np.arange(len(dates))
         return pd.DataFrame({
             'date': dates,
-            'calls': [100 + i * 5 + i ** 2 for i in range(len(dates))],
-            'success_rate': [0.75 + 0.01 * i for i in range(len(dates))],
-            'avg_duration': [180 + i * 2 for i in range(len(dates))]
+            'calls': 100 + i * 5 + i * i,
+            'success_rate': 0.75 + 0.01 * i,
+            'avg_duration': 180 + i * 2
         })
 
     def create_test_database(self):
         """Create and populate test database with sample data"""
-        # Create tables
-        create_table_query = text("""
-            CREATE TABLE IF NOT EXISTS calls (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                timestamp DATETIME,
-                duration INTEGER,
-                status TEXT,
-                phone_number TEXT,
-                agent_id INTEGER
-            )
-        """)
-        
         try:
             # Create table
             with self.engine.begin() as conn:
-                conn.execute(create_table_query)
+                conn.execute(_Q_CREATE_CALLS)
+                # Every dashboard query filters or groups on the call timestamp
+                conn.execute(_Q_CREATE_TS_INDEX)
                 
                 # Check if we already have data
-                result = conn.execute(text("SELECT COUNT(*) FROM calls"))
+                result = conn.execute(_Q_COUNT_CALLS)
                 count = result.scalar()
                 
                 if count == 0:
                     print("Populating database with sample data...")
-                    # Generate sample data
-                    now = datetime.now()
-                    sample_data = []
-                    
-                    for i in range(1000):  # Generate 1000 sample calls
-                        timestamp = now - timedelta(
-                            days=random.randint(0, 30),
-                            hours=random.randint(0, 23),
-                            minutes=random.randint(0, 59)
-                        )
-                        duration = random.randint(60, 600)  # 1-10 minutes
-                        status = random.choice(['completed', 'failed', 'no-answer'])
-                        phone_number = f"+1{random.randint(2000000000, 9999999999)}"
-                        agent_id = random.randint(1, 10)
-                        
-                        sample_data.append({
-                            'timestamp': timestamp,
-                            'duration': duration,
-                            'status': status,
-                            'phone_number': phone_number,
-                            'agent_id': agent_id
-                        })
-                    
-                    # Insert sample data
-                    insert_query = text("""
-                        INSERT INTO calls (timestamp, duration, status, phone_number, agent_id)
-                        VALUES (:timestamp, :duration, :status, :phone_number, :agent_id)
-                    """)
+                    # Generate sample data, one vectorized draw per column
+                    n = 1000  # Generate 1000 sample calls
+                    rng = np.random.default_rng()
+                    now = pd.Timestamp.now()
+                    offsets = (pd.to_timedelta(rng.integers(0, 31, n), unit='D')
+                               + pd.to_timedelta(rng.integers(0, 24, n), unit='h')
+                               + pd.to_timedelta(rng.integers(0, 60, n), unit='min'))
+                    timestamps = (now - offsets).strftime('%Y-%m-%d %H:%M:%S.%f')
+                    phone_numbers = np.char.add(
+                        '+1', rng.integers(2_000_000_000, 10_000_000_000, n).astype(str)
+                    )
+                    sample_data = list(zip(
+                        timestamps.tolist(),
+                        rng.integers(60, 601, n).tolist(),  # 1-10 minutes
+                        rng.choice(['completed', 'failed', 'no-answer'], n).tolist(),
+                        phone_numbers.tolist(),
+                        rng.integers(1, 11, n).tolist()
+                    ))
                     
-                    for data in sample_data:
-                        conn.execute(insert_query, data)
+                    # Insert sample data as positional rows straight through the driver
+                    conn.exec_driver_sql(_INSERT_CALLS_SQL, sample_data)
                     
                     print("Test database populated with sample data")
                 else:
@@ -1,12 +1,16 @@
 from typing import Dict, Any, List, Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, field, fields
 from datetime import datetime, timedelta
-import pandas as pd
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
+import numpy as np
 import json
-import statistics
+try:
+    import orjson
+except ImportError:
+    orjson = None
 from enum import Enum
+from collections import Counter, defaultdict, deque
+from itertools import islice
+import heapq
 
 class ContractMetricType(Enum):
     TOTAL_VALUE = "total_value"
@@ -16,7 +20,25 @@ class ContractMetricType(Enum):
     TIER_DISTRIBUTION = "tier_distribution"
     GEOGRAPHIC_DISTRIBUTION = "geographic_distribution"
 
-@dataclass
+# Contract column per metric: numeric metrics are summed per day,
+# distribution metrics are counted per day and category
+_NUMERIC_METRICS = {
+    ContractMetricType.TOTAL_VALUE: 'total_value',
+    ContractMetricType.MONTHLY_VALUE: 'monthly_value',
+    ContractMetricType.CONTRACT_TERM: 'term_months'
+}
+_DISTRIBUTION_METRICS = {
+    ContractMetricType.INDUSTRY_DISTRIBUTION: 'industry',
+    ContractMetricType.TIER_DISTRIBUTION: 'tier',
+    ContractMetricType.GEOGRAPHIC_DISTRIBUTION: 'region'
+}
+_EPOCH_ORDINAL = datetime(1970, 1, 1).toordinal()
+# Low-cardinality columns stored as int16 codes into a per-column vocabulary
+_CATEGORY_COLUMNS = ('industry', 'tier', 'region')
+# Projected recent contracts kept ready for the dashboard
+_RECENT_CAPACITY = 32
+
+@dataclass(frozen=True, slots=True)
 class HighTierMetrics:
     total_contract_value: float
     monthly_recurring_revenue: float
@@ -28,12 +50,126 @@ class HighTierMetrics:
     year_to_date_growth: float
     conversion_rate: float
 
+@dataclass(slots=True)
+class ContractRecord:
+    timestamp: datetime
+    total_value: float
+    monthly_value: float
+    term_months: float
+    industry: Optional[str]
+    tier: Optional[str]
+    region: Optional[str]
+    close_time_days: float
+    company_name: Optional[str]
+
+@dataclass
+class ContractColumns:
+    """Contract store with one array per field, grown by capacity doubling
+
+    Category columns hold int16 codes; labels[name][code] is the original
+    value, with codes assigned in first-seen order.
+    """
+    timestamps: np.ndarray
+    days: np.ndarray
+    total_value: np.ndarray
+    monthly_value: np.ndarray
+    term_months: np.ndarray
+    close_time_days: np.ndarray
+    industry: np.ndarray
+    tier: np.ndarray
+    region: np.ndarray
+    company_name: np.ndarray
+    size: int = 0
+    codes: Dict[str, Dict[Any, int]] = field(
+        default_factory=lambda: {name: {} for name in _CATEGORY_COLUMNS}
+    )
+    labels: Dict[str, List[Any]] = field(
+        default_factory=lambda: {name: [] for name in _CATEGORY_COLUMNS}
+    )
+
+    @classmethod
+    def empty(cls, capacity: int = 64) -> "ContractColumns":
+        """Allocate empty columns with room for capacity contracts"""
+        return cls(
+            timestamps=np.empty(capacity, dtype='datetime64[us]'),
+            days=np.empty(capacity, dtype=np.int32),
+            total_value=np.empty(capacity, dtype=np.float64),
+            monthly_value=np.empty(capacity, dtype=np.float64),
+            term_months=np.empty(capacity, dtype=np.float64),
+            close_time_days=np.empty(capacity, dtype=np.float64),
+            industry=np.empty(capacity, dtype=np.int16),
+            tier=np.empty(capacity, dtype=np.int16),
+            region=np.empty(capacity, dtype=np.int16),
+            company_name=np.empty(capacity, dtype=object)
+        )
+
+    def append(self, record: ContractRecord) -> None:
+        """Append one contract, doubling every column when full"""
+        if self.size == len(self.timestamps):
+            for column in fields(self):
+                old = getattr(self, column.name)
+                if not isinstance(old, np.ndarray):
+                    continue
+                grown = np.empty(2 * len(old), dtype=old.dtype)
+                grown[:self.size] = old
+                setattr(self, column.name, grown)
+        
+        i = self.size
+        self.timestamps[i] = record.timestamp
+        self.days[i] = record.timestamp.toordinal() - _EPOCH_ORDINAL
+        self.total_value[i] = record.total_value
+        self.monthly_value[i] = record.monthly_value
+        self.term_months[i] = record.term_months
+        self.close_time_days[i] = record.close_time_days
+        self.industry[i] = self._encode('industry', record.industry)
+        self.tier[i] = self._encode('tier', record.tier)
+        self.region[i] = self._encode('region', record.region)
+        self.company_name[i] = record.company_name
+        self.size = i + 1
+
+    def __len__(self) -> int:
+        return self.size
+
+    def column(self, name: str) -> np.ndarray:
+        """View of the filled part of a column"""
+        return getattr(self, name)[:self.size]
+
+    def _encode(self, name: str, value: Any) -> int:
+        """Code for a category value, extending the vocabulary on first sight"""
+        codes = self.codes[name]
+        code = codes.get(value)
+        if code is None:
+            code = codes[value] = len(codes)
+            self.labels[name].append(value)
+        return code
+
+    def label(self, name: str, i: int) -> Any:
+        """Decoded category value of contract i"""
+        return self.labels[name][getattr(self, name)[i]]
+
 class HighTierAnalyticsService:
     def __init__(self):
-        self.contracts: List[Dict[str, Any]] = []
-        self.metrics_history: Dict[str, List[Dict[str, Any]]] = {
-            metric_type.value: [] for metric_type in ContractMetricType
-        }
+        self.contracts = ContractColumns.empty()
+        self._reset_aggregates()
+        
+        # Contracts normally arrive in signing order; while timestamps keep
+        # strictly increasing, the newest contracts are simply the last ones
+        self._is_monotonic = True
+        self._last_timestamp: Optional[datetime] = None
+        # Newest-first dashboard projections, valid while inserts stay monotonic
+        self._recent: deque = deque(maxlen=_RECENT_CAPACITY)
+        
+        # Results below are pure functions of the stored contracts (and the
+        # current year), cached until the next insert bumps _version
+        self._version = 0
+        self._cached_metrics: Optional[HighTierMetrics] = None
+        self._cached_metrics_key = None
+        self._cached_time_series: Dict[ContractMetricType, Dict[str, List[Any]]] = {}
+        self._cached_time_series_ver = None
+        self._cached_dashboard: Optional[Dict[str, Any]] = None
+        self._cached_dashboard_key = None
+        self._cached_dashboard_json: Optional[bytes] = None
+        self._cached_dashboard_json_key = None
         
     def track_contract_signed(self,
                             contract_details: Dict[str, Any],
@@ -42,71 +178,70 @@ class HighTierAnalyticsService:
         """Track a new high-tier contract signing"""
         if not timestamp:
             timestamp = datetime.now()
-            
-        contract_data = {
-            "timestamp": timestamp,
-            "contract_details": contract_details,
-            "customer_info": customer_info,
-            "metrics": self._calculate_contract_metrics(contract_details, customer_info)
-        }
-        
-        self.contracts.append(contract_data)
-        self._update_metrics_history(contract_data)
+        elif timestamp.tzinfo is not None:
+            # Stored and bucketed as naive local time, like datetime.now()
+            timestamp = timestamp.astimezone().replace(tzinfo=None)
 
-    def _calculate_contract_metrics(self,
-                                 contract_details: Dict[str, Any],
-                                 customer_info: Dict[str, Any]) -> Dict[str, Any]:
-        """Calculate key metrics for a contract"""
-        contract_value = contract_details.get('value', {})
-        term_months = contract_details.get('terms', {}).get('initial_term_months', 0)
+        details_get = contract_details.get
+        customer_get = customer_info.get
+        contract_value = details_get('value', {})
+        record = ContractRecord(
+            timestamp,
+            contract_value.get('total', 0),
+            contract_value.get('monthly', 0),
+            details_get('terms', {}).get('initial_term_months', 0),
+            customer_get('industry'),
+            details_get('subscription_tier'),
+            customer_get('region', 'Unknown'),
+            details_get('sales_cycle_days', 0),
+            customer_get('company_name')
+        )
         
-        return {
-            "total_value": contract_value.get('total', 0),
-            "monthly_value": contract_value.get('monthly', 0),
-            "term_months": term_months,
-            "industry": customer_info.get('industry'),
-            "tier": contract_details.get('subscription_tier'),
-            "region": customer_info.get('region', 'Unknown'),
-            "close_time_days": contract_details.get('sales_cycle_days', 0)
-        }
+        if self._last_timestamp is not None and timestamp <= self._last_timestamp:
+            self._is_monotonic = False
+        self._last_timestamp = timestamp
+        self.contracts.append(record)
+        if self._is_monotonic:
+            self._recent.appendleft(self._project_recent(record))
+        self._update_aggregates(record)
+        self._version += 1
 
-    def _update_metrics_history(self, contract_data: Dict[str, Any]) -> None:
-        """Update historical metrics with new contract data"""
-        metrics = contract_data['metrics']
-        timestamp = contract_data['timestamp']
-        
-        # Update total value history
-        self.metrics_history[ContractMetricType.TOTAL_VALUE.value].append({
-            "timestamp": timestamp,
-            "value": metrics['total_value']
-        })
-        
-        # Update monthly value history
-        self.metrics_history[ContractMetricType.MONTHLY_VALUE.value].append({
-            "timestamp": timestamp,
-            "value": metrics['monthly_value']
-        })
-        
-        # Update term length history
-        self.metrics_history[ContractMetricType.CONTRACT_TERM.value].append({
-            "timestamp": timestamp,
-            "value": metrics['term_months']
-        })
-        
-        # Update distribution metrics
-        for metric_type, key in [
-            (ContractMetricType.INDUSTRY_DISTRIBUTION, 'industry'),
-            (ContractMetricType.TIER_DISTRIBUTION, 'tier'),
-            (ContractMetricType.GEOGRAPHIC_DISTRIBUTION, 'region')
-        ]:
-            self.metrics_history[metric_type.value].append({
-                "timestamp": timestamp,
-                "value": metrics[key]
-            })
+    def _reset_aggregates(self) -> None:
+        """Zero the running aggregates behind get_current_metrics"""
+        self._sum_total = 0.0
+        self._sum_monthly = 0.0
+        self._sum_term = 0.0
+        self._count = 0
+        self._positive_cycle_count = 0
+        self._ytd_sum: Dict[int, float] = defaultdict(float)
+        self._dist_industry: Counter = Counter()
+        self._dist_tier: Counter = Counter()
+        self._dist_region: Counter = Counter()
+
+    def _update_aggregates(self, record: ContractRecord) -> None:
+        """Fold one contract into the running aggregates"""
+        self._sum_total += record.total_value
+        self._sum_monthly += record.monthly_value
+        self._sum_term += record.term_months
+        self._count += 1
+        if record.close_time_days > 0:
+            self._positive_cycle_count += 1
+        self._ytd_sum[record.timestamp.year] += record.total_value
+        self._dist_industry[record.industry] += 1
+        self._dist_tier[record.tier] += 1
+        self._dist_region[record.region] += 1
 
     def get_current_metrics(self) -> HighTierMetrics:
-        """Get current high-tier contract metrics"""
-        if not self.contracts:
+        """Get current high-tier contract metrics (cached; treat as read-only)"""
+        key = (self._version, datetime.now().year)
+        if self._cached_metrics_key != key:
+            self._cached_metrics = self._compute_current_metrics(key[1])
+            self._cached_metrics_key = key
+        return self._cached_metrics
+
+    def _compute_current_metrics(self, current_year: int) -> HighTierMetrics:
+        """Build HighTierMetrics from the running aggregates"""
+        if not self._count:
             return HighTierMetrics(
                 total_contract_value=0,
                 monthly_recurring_revenue=0,
@@ -119,21 +254,9 @@ class HighTierAnalyticsService:
                 conversion_rate=0
             )
         
-        # Calculate current year metrics
-        current_year = datetime.now().year
-        ytd_contracts = [
-            contract for contract in self.contracts
-            if contract['timestamp'].year == current_year
-        ]
-        
-        # Calculate year-to-date growth
-        previous_year_contracts = [
-            contract for contract in self.contracts
-            if contract['timestamp'].year == current_year - 1
-        ]
-        
-        ytd_value = sum(c['metrics']['total_value'] for c in ytd_contracts)
-        previous_year_value = sum(c['metrics']['total_value'] for c in previous_year_contracts)
+        # Year-to-date growth against the previous calendar year
+        ytd_value = self._ytd_sum.get(current_year, 0.0)
+        previous_year_value = self._ytd_sum.get(current_year - 1, 0.0)
         
         ytd_growth = (
             ((ytd_value - previous_year_value) / previous_year_value * 100)
@@ -142,47 +265,62 @@ class HighTierAnalyticsService:
         
         # Calculate current metrics
         return HighTierMetrics(
-            total_contract_value=sum(c['metrics']['total_value'] for c in self.contracts),
-            monthly_recurring_revenue=sum(c['metrics']['monthly_value'] for c in self.contracts),
-            average_contract_term=statistics.mean(c['metrics']['term_months'] for c in self.contracts),
-            contract_count=len(self.contracts),
-            industry_breakdown=self._calculate_distribution('industry'),
-            tier_breakdown=self._calculate_distribution('tier'),
-            geographic_breakdown=self._calculate_distribution('region'),
+            total_contract_value=self._sum_total,
+            monthly_recurring_revenue=self._sum_monthly,
+            average_contract_term=self._sum_term / self._count,
+            contract_count=self._count,
+            industry_breakdown=dict(self._dist_industry),
+            tier_breakdown=dict(self._dist_tier),
+            geographic_breakdown=dict(self._dist_region),
             year_to_date_growth=ytd_growth,
             conversion_rate=self._calculate_conversion_rate()
         )
 
-    def _calculate_distribution(self, key: str) -> Dict[str, int]:
-        """Calculate distribution of contracts by a specific key"""
-        distribution = {}
-        for contract in self.contracts:
-            value = contract['metrics'][key]
-            distribution[value] = distribution.get(value, 0) + 1
-        return distribution
-
     def _calculate_conversion_rate(self) -> float:
         """Calculate conversion rate for high-tier contracts"""
-        total_opportunities = sum(1 for c in self.contracts if 'sales_cycle_days' in c['metrics'])
-        if not total_opportunities:
+        # Every tracked contract is an opportunity; it counts as converted
+        # once it records a positive sales cycle
+        if not self._count:
             return 0
-        
-        successful_conversions = sum(
-            1 for c in self.contracts
-            if c['metrics'].get('sales_cycle_days', 0) > 0
-        )
-        
-        return (successful_conversions / total_opportunities) * 100
+        return 100.0 * self._positive_cycle_count / self._count
 
     def generate_dashboard_data(self) -> Dict[str, Any]:
-        """Generate data for the high-tier contracts dashboard"""
+        """Generate data for the high-tier contracts dashboard (cached; treat as read-only)"""
+        key = (self._version, datetime.now().year)
+        if self._cached_dashboard_key != key:
+            self._cached_dashboard = self._build_dashboard_data()
+            self._cached_dashboard_key = key
+        return self._cached_dashboard
+
+    def generate_dashboard_json(self) -> bytes:
+        """Dashboard payload serialized to JSON bytes (cached)"""
+        key = (self._version, datetime.now().year)
+        if self._cached_dashboard_json_key != key:
+            if orjson is not None:
+                # orjson writes the time series value arrays directly
+                self._cached_dashboard_json = orjson.dumps(
+                    self._build_dashboard_data(raw=True),
+                    option=orjson.OPT_SERIALIZE_NUMPY
+                )
+            else:
+                self._cached_dashboard_json = json.dumps(
+                    self.generate_dashboard_data(), separators=(",", ":")
+                ).encode()
+            self._cached_dashboard_json_key = key
+        return self._cached_dashboard_json
+
+    def _build_dashboard_data(self, raw: bool = False) -> Dict[str, Any]:
+        """Assemble the dashboard payload from current metrics and history
+
+        With raw=True the time series values are left as NumPy arrays.
+        """
         metrics = self.get_current_metrics()
         
         # Prepare time series data
         time_series_data = {
-            "total_value": self._prepare_time_series(ContractMetricType.TOTAL_VALUE),
-            "monthly_value": self._prepare_time_series(ContractMetricType.MONTHLY_VALUE),
-            "contract_terms": self._prepare_time_series(ContractMetricType.CONTRACT_TERM)
+            "total_value": self._prepare_time_series(ContractMetricType.TOTAL_VALUE, raw),
+            "monthly_value": self._prepare_time_series(ContractMetricType.MONTHLY_VALUE, raw),
+            "contract_terms": self._prepare_time_series(ContractMetricType.CONTRACT_TERM, raw)
         }
         
         # Prepare distribution data
@@ -206,19 +344,56 @@ class HighTierAnalyticsService:
             "recent_contracts": self._get_recent_contracts(5)
         }
 
-    def _prepare_time_series(self, metric_type: ContractMetricType) -> Dict[str, List[Any]]:
-        """Prepare time series data for visualization"""
-        data = self.metrics_history[metric_type.value]
-        if not data:
-            return {"dates": [], "values": []}
-            
-        df = pd.DataFrame(data)
-        df.set_index('timestamp', inplace=True)
-        df = df.resample('D').sum()  # Daily aggregation
+    def _prepare_time_series(self, metric_type: ContractMetricType, raw: bool = False) -> Dict[str, Any]:
+        """Prepare time series data for visualization
+
+        Numeric series keep their values as a NumPy array when raw is set.
+        """
+        if self._cached_time_series_ver != self._version:
+            self._cached_time_series = {}
+            self._cached_time_series_ver = self._version
+        if metric_type not in self._cached_time_series:
+            self._cached_time_series[metric_type] = self._resample_daily(metric_type)
+        series = self._cached_time_series[metric_type]
+        if raw or metric_type not in _NUMERIC_METRICS:
+            return series
+        return {"dates": series["dates"], "values": series["values"].tolist()}
+
+    def _resample_daily(self, metric_type: ContractMetricType) -> Dict[str, Any]:
+        """Aggregate a metric per calendar day straight from the contract columns
+
+        Numeric metrics give one summed value per day; distribution metrics
+        give a per-day count list for each category label.
+        """
+        contracts = self.contracts
+        numeric = metric_type in _NUMERIC_METRICS
+        if not contracts:
+            return {"dates": [], "values": np.zeros(0) if numeric else {}}
+        
+        days = contracts.column('days')
+        lo = int(days.min())
+        span = int(days.max()) - lo + 1
+        day_idx = days.astype(np.intp) - lo
+        dates = np.arange(lo, lo + span).astype('datetime64[D]').astype(str).tolist()
+        
+        if numeric:
+            values = np.bincount(
+                day_idx,
+                weights=contracts.column(_NUMERIC_METRICS[metric_type]),
+                minlength=span
+            )
+            return {"dates": dates, "values": values}
         
+        # One bincount over combined (day, category code) cells
+        key = _DISTRIBUTION_METRICS[metric_type]
+        labels = contracts.labels[key]
+        counts = np.bincount(
+            day_idx * len(labels) + contracts.column(key),
+            minlength=span * len(labels)
+        ).reshape(span, len(labels))
         return {
-            "dates": df.index.strftime('%Y-%m-%d').tolist(),
-            "values": df['value'].tolist()
+            "dates": dates,
+            "values": {label: counts[:, code].tolist() for code, label in enumerate(labels)}
         }
 
     def _prepare_distribution_chart(self, distribution: Dict[str, int]) -> Dict[str, List[Any]]:
@@ -228,19 +403,38 @@ class HighTierAnalyticsService:
             "values": list(distribution.values())
         }
 
+    @staticmethod
+    def _project_recent(record: ContractRecord) -> Dict[str, Any]:
+        """Shape one contract as a recent-contracts dashboard entry"""
+        return {
+            "company_name": record.company_name,
+            "industry": record.industry,
+            "tier": record.tier,
+            "total_value": float(record.total_value),
+            "signed_date": record.timestamp.strftime('%Y-%m-%d'),
+            "term_months": float(record.term_months)
+        }
+
     def _get_recent_contracts(self, limit: int) -> List[Dict[str, Any]]:
-        """Get most recent high-tier contracts"""
-        sorted_contracts = sorted(
-            self.contracts,
-            key=lambda x: x['timestamp'],
-            reverse=True
-        )
+        """Get most recent high-tier contracts (entries are shared; treat as read-only)"""
+        if self._is_monotonic and limit <= _RECENT_CAPACITY:
+            return list(islice(self._recent, limit))
+        
+        contracts = self.contracts
+        n = len(contracts)
+        if self._is_monotonic:
+            order = np.arange(n - 1, max(n - limit, 0) - 1, -1)
+        else:
+            # nlargest keeps insertion order among equal timestamps, like sorted(reverse=True)
+            timestamps = contracts.column('timestamps').astype(np.int64).tolist()
+            order = np.array(heapq.nlargest(limit, range(n), key=timestamps.__getitem__), dtype=np.intp)
+        signed_dates = contracts.column('timestamps')[order].astype('datetime64[D]').astype(str)
         
         return [{
-            "company_name": contract['customer_info'].get('company_name'),
-            "industry": contract['metrics']['industry'],
-            "tier": contract['metrics']['tier'],
-            "total_value": contract['metrics']['total_value'],
-            "signed_date": contract['timestamp'].strftime('%Y-%m-%d'),
-            "term_months": contract['metrics']['term_months']
-        } for contract in sorted_contracts[:limit]] 
\ No newline at end of file
+            "company_name": contracts.company_name[i],
+            "industry": contracts.label('industry', i),
+            "tier": contracts.label('tier', i),
+            "total_value": float(contracts.total_value[i]),
+            "signed_date": signed_date,
+            "term_months": float(contracts.term_months[i])
+        } for i, signed_date in zip(order.tolist(), signed_dates.tolist())]
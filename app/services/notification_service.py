@@ -5,10 +5,66 @@ import smtplib
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 import os
+import string
+import threading
+from concurrent.futures import ThreadPoolExecutor
 import requests
 from enum import Enum
 from app.services.high_tier_analytics import HighTierAnalyticsService
 
+# Email and SMS go out on separate threads; both are network-bound
+_NOTIFY_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix='notify')
+
+# Email markup is parsed once here; sends only substitute the values
+_HIGH_TIER_EMAIL_TEMPLATE = string.Template("""
+        <html>
+        <body style="font-family: Arial, sans-serif; max-width: 600px; margin: 0 auto;">
+            <div style="background: linear-gradient(135deg, #1a237e, #0d47a1); color: white; padding: 20px; border-radius: 10px;">
+                <h1 style="text-align: center; color: gold;">🎉 High-Tier Contract Signed! 🎉</h1>
+                
+                <div style="background: rgba(255, 255, 255, 0.1); padding: 15px; border-radius: 5px; margin: 10px 0;">
+                    <h2 style="color: #ffd700;">Customer Information</h2>
+                    <p><strong>Company:</strong> ${company_name}</p>
+                    <p><strong>Industry:</strong> ${industry}</p>
+                </div>
+                
+                <div style="background: rgba(255, 255, 255, 0.1); padding: 15px; border-radius: 5px; margin: 10px 0;">
+                    <h2 style="color: #ffd700;">Contract Details</h2>
+                    <p><strong>Type:</strong> ${tier}</p>
+                    <p><strong>Term:</strong> ${term_months} months</p>
+                    <p><strong>Monthly Value:</strong> <span style="color: #ffd700; font-size: 1.2em;">$$${monthly_value}</span></p>
+                    <p><strong>Total Contract Value:</strong> <span style="color: #ffd700; font-size: 1.4em;">$$${total_value}</span></p>
+                    <p><strong>Start Date:</strong> ${start_date}</p>
+                </div>
+                
+                <div style="background: rgba(255, 255, 255, 0.1); padding: 15px; border-radius: 5px; margin: 10px 0;">
+                    <h2 style="color: #ffd700;">Primary Contact</h2>
+                    <p><strong>Name:</strong> ${contact_name}</p>
+                    <p><strong>Email:</strong> ${email}</p>
+                    <p><strong>Phone:</strong> ${phone}</p>
+                </div>
+                
+                ${analytics_section}
+            </div>
+        </body>
+        </html>
+        """)
+
+_ANALYTICS_SECTION_TEMPLATE = string.Template("""
+        <div style="background: rgba(255, 255, 255, 0.1); padding: 15px; border-radius: 5px; margin: 10px 0;">
+            <h2 style="color: #ffd700;">High-Tier Contract Analytics</h2>
+            <p><strong>Total High-Tier Contracts:</strong> ${contract_count}</p>
+            <p><strong>Total Contract Value:</strong> <span style="color: #ffd700;">$$${total_contract_value}</span></p>
+            <p><strong>YTD Growth:</strong> <span style="color: #ffd700;">${ytd_growth}%</span></p>
+            <p><strong>Average Contract Term:</strong> ${average_term} months</p>
+            <p><a href="/dashboard" style="color: #ffd700; text-decoration: none;">View Full Analytics Dashboard →</a></p>
+        </div>
+        """)
+
+def _format_currency(value: float) -> str:
+    """Dollar amount with thousands separators and cents"""
+    return f"{value:,.2f}"
+
 class NotificationType(Enum):
     LIVE_PERSON_REQUEST = "live_person_request"
     CONTRACT_SIGNED = "contract_signed"
@@ -29,22 +85,65 @@ class NotificationConfig:
     notification_preferences: Dict[str, List[str]]  # type -> ["email", "sms"]
     high_tier_thresholds: Dict[str, float]  # subscription_tier -> monthly_value
 
+    def __post_init__(self):
+        """Validate configuration and credentials once, at construction"""
+        if not self.email_address:
+            raise ValueError("Missing required configuration: email_address")
+        if not self.phone_number:
+            raise ValueError("Missing required configuration: phone_number")
+        if not self.smtp_server:
+            raise ValueError("Missing required configuration: smtp_server")
+        if not self.smtp_port:
+            raise ValueError("Missing required configuration: smtp_port")
+        if not self.smtp_username:
+            raise ValueError("Missing required configuration: smtp_username")
+        if not self.smtp_password:
+            raise ValueError("Missing required configuration: smtp_password")
+
 class NotificationService:
     def __init__(self, config: NotificationConfig, analytics_service: Optional[HighTierAnalyticsService] = None):
         self.config = config
         self.analytics_service = analytics_service
-        self._validate_config()
-        
-    def _validate_config(self):
-        """Validate configuration and credentials"""
-        required_fields = [
-            'email_address', 'phone_number', 'smtp_server', 
-            'smtp_port', 'smtp_username', 'smtp_password'
-        ]
+        # Connections reused across notifications; SMTP is opened on first send
+        self._smtp: Optional[smtplib.SMTP] = None
+        self._smtp_lock = threading.Lock()
+        self._http = requests.Session()
+
+    def close(self) -> None:
+        """Close the pooled SMTP and HTTP connections"""
+        with self._smtp_lock:
+            self._close_smtp()
+        self._http.close()
+
+    def _get_smtp(self) -> smtplib.SMTP:
+        """Connected, authenticated SMTP handle, reconnecting if the server dropped it"""
+        if self._smtp is not None:
+            try:
+                if self._smtp.noop()[0] == 250:
+                    return self._smtp
+            except (smtplib.SMTPException, OSError):
+                pass
+            self._close_smtp()
         
-        for field in required_fields:
-            if not getattr(self.config, field):
-                raise ValueError(f"Missing required configuration: {field}")
+        server = smtplib.SMTP(self.config.smtp_server, self.config.smtp_port)
+        try:
+            server.starttls()
+            server.login(self.config.smtp_username, self.config.smtp_password)
+        except Exception:
+            server.close()
+            raise
+        self._smtp = server
+        return server
+
+    def _close_smtp(self) -> None:
+        """Drop the SMTP connection, if any"""
+        if self._smtp is None:
+            return
+        try:
+            self._smtp.quit()
+        except (smtplib.SMTPException, OSError):
+            self._smtp.close()
+        self._smtp = None
 
     def notify_live_person_request(self,
                                  prospect_info: Dict[str, Any],
@@ -175,39 +274,19 @@ class NotificationService:
         if self.analytics_service:
             analytics_metrics = self.analytics_service.get_current_metrics()
         
-        email_body = f"""
-        <html>
-        <body style="font-family: Arial, sans-serif; max-width: 600px; margin: 0 auto;">
-            <div style="background: linear-gradient(135deg, #1a237e, #0d47a1); color: white; padding: 20px; border-radius: 10px;">
-                <h1 style="text-align: center; color: gold;">🎉 High-Tier Contract Signed! 🎉</h1>
-                
-                <div style="background: rgba(255, 255, 255, 0.1); padding: 15px; border-radius: 5px; margin: 10px 0;">
-                    <h2 style="color: #ffd700;">Customer Information</h2>
-                    <p><strong>Company:</strong> {customer_info.get('company_name')}</p>
-                    <p><strong>Industry:</strong> {customer_info.get('industry')}</p>
-                </div>
-                
-                <div style="background: rgba(255, 255, 255, 0.1); padding: 15px; border-radius: 5px; margin: 10px 0;">
-                    <h2 style="color: #ffd700;">Contract Details</h2>
-                    <p><strong>Type:</strong> {contract_details.get('subscription_tier')}</p>
-                    <p><strong>Term:</strong> {term_months} months</p>
-                    <p><strong>Monthly Value:</strong> <span style="color: #ffd700; font-size: 1.2em;">${contract_value.get('monthly', 0):,.2f}</span></p>
-                    <p><strong>Total Contract Value:</strong> <span style="color: #ffd700; font-size: 1.4em;">${contract_value.get('total', 0):,.2f}</span></p>
-                    <p><strong>Start Date:</strong> {contract_details.get('terms', {}).get('start_date')}</p>
-                </div>
-                
-                <div style="background: rgba(255, 255, 255, 0.1); padding: 15px; border-radius: 5px; margin: 10px 0;">
-                    <h2 style="color: #ffd700;">Primary Contact</h2>
-                    <p><strong>Name:</strong> {customer_info.get('contact_name')}</p>
-                    <p><strong>Email:</strong> {customer_info.get('email')}</p>
-                    <p><strong>Phone:</strong> {customer_info.get('phone')}</p>
-                </div>
-                
-                {self._generate_analytics_section(analytics_metrics) if analytics_metrics else ''}
-            </div>
-        </body>
-        </html>
-        """
+        email_body = _HIGH_TIER_EMAIL_TEMPLATE.substitute(
+            company_name=customer_info.get('company_name'),
+            industry=customer_info.get('industry'),
+            tier=contract_details.get('subscription_tier'),
+            term_months=term_months,
+            monthly_value=_format_currency(contract_value.get('monthly', 0)),
+            total_value=_format_currency(contract_value.get('total', 0)),
+            start_date=contract_details.get('terms', {}).get('start_date'),
+            contact_name=customer_info.get('contact_name'),
+            email=customer_info.get('email'),
+            phone=customer_info.get('phone'),
+            analytics_section=self._generate_analytics_section(analytics_metrics) if analytics_metrics else ''
+        )
 
         sms_body = (
             f"🌟 HIGH-TIER CONTRACT SIGNED! 🌟\n"
@@ -227,16 +306,12 @@ class NotificationService:
 
     def _generate_analytics_section(self, metrics: Any) -> str:
         """Generate analytics section for high-tier contract email"""
-        return f"""
-        <div style="background: rgba(255, 255, 255, 0.1); padding: 15px; border-radius: 5px; margin: 10px 0;">
-            <h2 style="color: #ffd700;">High-Tier Contract Analytics</h2>
-            <p><strong>Total High-Tier Contracts:</strong> {metrics.contract_count}</p>
-            <p><strong>Total Contract Value:</strong> <span style="color: #ffd700;">${metrics.total_contract_value:,.2f}</span></p>
-            <p><strong>YTD Growth:</strong> <span style="color: #ffd700;">{metrics.year_to_date_growth:+.1f}%</span></p>
-            <p><strong>Average Contract Term:</strong> {metrics.average_contract_term:.1f} months</p>
-            <p><a href="/dashboard" style="color: #ffd700; text-decoration: none;">View Full Analytics Dashboard →</a></p>
-        </div>
-        """
+        return _ANALYTICS_SECTION_TEMPLATE.substitute(
+            contract_count=metrics.contract_count,
+            total_contract_value=_format_currency(metrics.total_contract_value),
+            ytd_growth=f"{metrics.year_to_date_growth:+.1f}",
+            average_term=f"{metrics.average_contract_term:.1f}"
+        )
 
     def _send_notifications(self,
                           notification_type: NotificationType,
@@ -251,10 +326,17 @@ class NotificationService:
             ["email", "sms"]  # Default to both if not specified
         )
         
-        if "email" in preferences:
+        send_email = "email" in preferences
+        send_sms = "sms" in preferences
+        
+        if send_email and send_sms:
+            # Send both channels at once rather than waiting on one then the other
+            sms_future = _NOTIFY_POOL.submit(self._send_sms, sms_body)
             success &= self._send_email(subject, email_body, is_html)
-            
-        if "sms" in preferences:
+            success &= sms_future.result()
+        elif send_email:
+            success &= self._send_email(subject, email_body, is_html)
+        elif send_sms:
             success &= self._send_sms(sms_body)
             
         return success
@@ -269,10 +351,14 @@ class NotificationService:
             
             msg.attach(MIMEText(body, 'html' if is_html else 'plain'))
             
-            with smtplib.SMTP(self.config.smtp_server, self.config.smtp_port) as server:
-                server.starttls()
-                server.login(self.config.smtp_username, self.config.smtp_password)
-                server.send_message(msg)
+            # One SMTP conversation at a time on the shared connection
+            with self._smtp_lock:
+                try:
+                    self._get_smtp().send_message(msg)
+                except smtplib.SMTPServerDisconnected:
+                    # Connection dropped between the NOOP check and the send
+                    self._close_smtp()
+                    self._get_smtp().send_message(msg)
             
             return True
             
@@ -297,7 +383,7 @@ class NotificationService:
                 "Body": body
             }
             
-            response = requests.post(
+            response = self._http.post(
                 url,
                 data=payload,
                 auth=(self.config.twilio_account_sid, self.config.twilio_auth_token)
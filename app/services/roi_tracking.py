@@ -1,8 +1,14 @@
 from typing import Dict, Any, List, Optional
 from dataclasses import dataclass
+from functools import cached_property
 from datetime import datetime, timedelta
 from enum import Enum
-import statistics
+import numpy as np
+
+def fast_mean(values: Dict[str, float]) -> float:
+    """Mean of a metric dict's values, 0.0 when empty"""
+    arr = np.fromiter(values.values(), dtype=np.float64, count=len(values))
+    return float(arr.mean()) if arr.size else 0.0
 
 class ImplementationPhase(Enum):
     INITIAL_CONTACT = "initial_contact"
@@ -35,6 +41,23 @@ class ImplementationMetrics:
     efficiency_metrics: Dict[str, float]
     quality_metrics: Dict[str, float]
 
+    @cached_property
+    def traditional_cost_total(self) -> float:
+        return sum(self.traditional_costs.values())
+
+    @cached_property
+    def actual_cost_total(self) -> float:
+        return sum(self.actual_costs.values())
+
+    @cached_property
+    def savings(self) -> float:
+        return self.traditional_cost_total - self.actual_cost_total
+
+    def invalidate_cost_totals(self):
+        """Drop cached cost totals after the cost dicts are modified"""
+        for name in ("traditional_cost_total", "actual_cost_total", "savings"):
+            self.__dict__.pop(name, None)
+
 class ROITrackingService:
     def __init__(self):
         self.implementation_data: Dict[str, ImplementationMetrics] = {}
@@ -101,6 +124,7 @@ class ROITrackingService:
         
         # Update costs and metrics
         implementation.actual_costs.update(actual_costs)
+        implementation.invalidate_cost_totals()
         if phase == ImplementationPhase.GO_LIVE:
             implementation.completion_date = datetime.now()
         
@@ -127,22 +151,22 @@ class ROITrackingService:
         )
         
         # Calculate cost savings
-        traditional_total = sum(implementation.traditional_costs.values())
-        actual_total = sum(implementation.actual_costs.values())
-        savings = traditional_total - actual_total
+        traditional_total = implementation.traditional_cost_total
+        actual_total = implementation.actual_cost_total
+        savings = implementation.savings
         
         # Calculate efficiency gains
         efficiency_improvement = 0
         if implementation.efficiency_metrics:
             efficiency_improvement = (
-                statistics.mean(implementation.efficiency_metrics.values()) * 100
+                fast_mean(implementation.efficiency_metrics) * 100
             )
         
         # Calculate quality improvements
         quality_improvement = 0
         if implementation.quality_metrics:
             quality_improvement = (
-                statistics.mean(implementation.quality_metrics.values()) * 100
+                fast_mean(implementation.quality_metrics) * 100
             )
         
         # Calculate ROI
@@ -207,9 +231,9 @@ class ROITrackingService:
                 n
             )
             
-            traditional_total = sum(implementation.traditional_costs.values())
-            actual_total = sum(implementation.actual_costs.values())
-            savings_pct = ((traditional_total - actual_total) / traditional_total * 100
+            traditional_total = implementation.traditional_cost_total
+            actual_total = implementation.actual_cost_total
+            savings_pct = (implementation.savings / traditional_total * 100
                          if traditional_total > 0 else 0)
             current["avg_cost_savings"] = self._running_average(
                 current["avg_cost_savings"],
@@ -218,7 +242,7 @@ class ROITrackingService:
             )
             
             if implementation.efficiency_metrics:
-                efficiency_gain = statistics.mean(implementation.efficiency_metrics.values()) * 100
+                efficiency_gain = fast_mean(implementation.efficiency_metrics) * 100
                 current["avg_efficiency_gain"] = self._running_average(
                     current["avg_efficiency_gain"],
                     efficiency_gain,
@@ -226,7 +250,7 @@ class ROITrackingService:
                 )
             
             if implementation.quality_metrics:
-                quality_improvement = statistics.mean(implementation.quality_metrics.values()) * 100
+                quality_improvement = fast_mean(implementation.quality_metrics) * 100
                 current["avg_quality_improvement"] = self._running_average(
                     current["avg_quality_improvement"],
                     quality_improvement,
@@ -250,9 +274,9 @@ class ROITrackingService:
         implementation = self.implementation_data[client_id]
         current_duration = sum(implementation.phase_durations.values(), timedelta())
         
-        traditional_costs = sum(implementation.traditional_costs.values())
-        actual_costs = sum(implementation.actual_costs.values())
-        current_savings = traditional_costs - actual_costs
+        traditional_costs = implementation.traditional_cost_total
+        actual_costs = implementation.actual_cost_total
+        current_savings = implementation.savings
         
         return {
             "current_phase": self._get_current_phase(implementation),
@@ -1,5 +1,6 @@
 from typing import Dict, Any
 from app.services.cost_analysis_service import AdvancedCostAnalysisService
+from app.services.advanced_cost_analysis import format_tco
 from app.services.roi_calculator import AdvancedROICalculator
 from app.services.industry_tracks import IndustryTracksService
 from app.core.default_agent import DEFAULT_AGENT_CONFIG
@@ -50,7 +51,7 @@ class SalesOrchestrator:
         
         return {
             "industry_track": industry_track,
-            "cost_analysis": cost_analysis,
+            "cost_analysis": format_tco(cost_analysis),
             "subscription": subscription,
             "roi_analysis": roi_analysis,
             "conversation_strategy": conversation_strategy
@@ -65,7 +66,7 @@ class SalesOrchestrator:
         
         # Key talking points based on cost analysis
         cost_points = [
-            f"Current cost per call: ${cost_analysis['cost_per_call']}",
+            f"Current cost per call: ${cost_analysis['cost_per_call']:.2f}",
             f"Potential cost reduction: {subscription['cost_reduction_percentage']}%",
             f"Annual savings: ${roi_analysis['summary']['total_annual_savings']:,.2f}",
             f"ROI timeline: {roi_analysis['summary']['payback_period_months']} months"
@@ -82,7 +83,7 @@ class SalesOrchestrator:
         for competitor, analysis in cost_analysis["competitive_analysis"].items():
             if analysis["savings_percentage"] > 0:
                 competitive_edges.append(
-                    f"{analysis['savings_percentage']}% savings vs {competitor}"
+                    f"{analysis['savings_percentage']:.1f}% savings vs {competitor}"
                 )
         
         # ROI highlights